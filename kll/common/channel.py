@@ -36,6 +36,7 @@ class Channel(object):
     '''
     Pixel Channel Container
     '''
+    __slots__ = ('uid', 'width')
 
     def __init__(self, uid, width):
         self.uid = uid
@@ -53,24 +54,24 @@ class ChannelList(object):
     def __init__(self):
         self.channels = []
 
+        # Cached strChannels output
+        self._channels_str = None
+
     def setChannels(self, channel_list):
         '''
         Apply channels to Pixel
         '''
         for channel in channel_list:
             self.channels.append(Channel(channel[0], channel[1]))
+        self._channels_str = None
 
     def strChannels(self):
         '''
         __repr__ of Channel when multiple inheritance is used
         '''
-        output = ""
-        for index, channel in enumerate(self.channels):
-            if index > 0:
-                output += ","
-            output += "{0}".format(channel)
-
-        return output
+        if self._channels_str is None:
+            self._channels_str = ",".join(str(channel) for channel in self.channels)
+        return self._channels_str
 
     def __repr__(self):
         return self.strChannels()
@@ -34,6 +34,8 @@ from collections import OrderedDict
 ERROR = '\033[5;1;31mERROR\033[0m:'
 WARNING = '\033[5;1;33mWARNING\033[0m:'
 
+# Template fill tag, <|tag|>
+template_tag = re.compile(r'<\|([^|>]+)\|>')
 
 
 ### Classes ###
@@ -160,6 +162,9 @@ class TextEmitter(object):
     load_template('_myfile2.h')
     generate('/tmp/myfile2.h')
 
+    fill_dict values may either be a string or a list of string fragments.
+    Fragments are written out in order, so large tables never have to be concatenated.
+
     TODO
     - Generate list of unused tags
     '''
@@ -174,6 +179,10 @@ class TextEmitter(object):
 
         self.template = None
 
+        # Template contents and the (start, end, tag) span of each line holding a fill tag
+        self.template_text = None
+        self.template_spans = []
+
     def load_template(self, template):
         '''
         Loads template file
@@ -190,12 +199,36 @@ class TextEmitter(object):
 
         self.template = template
 
-        # Generate list of fill tags
         with open(template, 'r') as openFile:
-            for line in openFile:
-                match = re.findall(r'<\|([^|>]+)\|>', line)
-                for item in match:
-                    self.tag_list.append(item)
+            self.template_text = openFile.read()
+
+        # Generate list of fill tags, and the template lines they replace
+        # Only the first tag on a line is filled
+        self.template_spans = []
+        for match in template_tag.finditer(self.template_text):
+            self.tag_list.append(match.group(1))
+
+            start = self.template_text.rfind('\n', 0, match.start()) + 1
+            if self.template_spans and start < self.template_spans[-1][1]:
+                continue
+
+            end = self.template_text.find('\n', match.end())
+            end = len(self.template_text) if end == -1 else end + 1
+            self.template_spans.append((start, end, match.group(1)))
+
+    def trim_fill(self, tag, count):
+        '''
+        Removes trailing characters from a fill_dict fragment list
+
+        @param tag:   fill_dict tag
+        @param count: Number of characters to remove from the end
+        '''
+        fragments = self.fill_dict[tag]
+        while count > 0 and fragments:
+            last = fragments.pop()
+            if len(last) > count:
+                fragments.append(last[:-count])
+            count -= len(last)
 
     def generate(self, output_path):
         '''
@@ -209,27 +242,28 @@ class TextEmitter(object):
                 "{0} TextEmitter template (load_template) has not been called.".format(ERROR))
             sys.exit(1)
 
-        # Process each line of the template, outputting to the target path
+        # Copy the template between tagged lines, replacing each tagged line with its processed variable
+        # TODO Support multiple replacements per line
+        # TODO Support replacement with other text inline
         with open(output_path, 'w') as outputFile:
-            with open(self.template, 'r') as templateFile:
-                for line in templateFile:
-                    # TODO Support multiple replacements per line
-                    # TODO Support replacement with other text inline
-                    match = re.findall(r'<\|([^|>]+)\|>', line)
-
-                    # If match, replace with processed variable
-                    if match:
-                        try:
-                            outputFile.write(self.fill_dict[match[0]])
-                        except KeyError:
-                            print("{0} '{1}' not found, skipping...".format(
-                                WARNING, match[0]
-                            ))
-                        outputFile.write("\n")
-
-                    # Otherwise, just append template to output file
+            position = 0
+            for start, end, tag in self.template_spans:
+                outputFile.write(self.template_text[position:start])
+                position = end
+
+                try:
+                    fill = self.fill_dict[tag]
+                    if isinstance(fill, list):
+                        outputFile.writelines(fill)
                     else:
-                        outputFile.write(line)
+                        outputFile.write(fill)
+                except KeyError:
+                    print("{0} '{1}' not found, skipping...".format(
+                        WARNING, tag
+                    ))
+                outputFile.write("\n")
+
+            outputFile.write(self.template_text[position:])
 
 
 class JsonEmitter(object):
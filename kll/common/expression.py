@@ -39,6 +39,8 @@ WARNING = '\033[5;1;33mWARNING\033[0m:'
 class Expression:
     '''
     Container class for KLL expressions
+
+    Use make_expression() to build an expression of the type matching its operator
     '''
 
     def __init__(self, lparam, operator, rparam, context):
@@ -66,13 +68,20 @@ class Expression:
         # Default ConnectId
         self.connect_id = 0
 
-        # Mutate class into the desired type
-        self.__class__ = {
-            '=>': NameAssociationExpression,
-            '<=': DataAssociationExpression,
-            '=': AssignmentExpression,
-            ':': MapExpression,
-        }[self.operator_type()]
+        # Cached string representations
+        self._regen_str = None
+        self.clear_cache()
+
+    def __copy__(self):
+        '''
+        Shallow copy of the expression
+
+        Expressions are copied for every expanded trigger variant (see unique_keys).
+        Copying the attribute dictionary directly skips the generic reduce/reconstruct path of copy.copy.
+        '''
+        new_obj = object.__new__(self.__class__)
+        new_obj.__dict__.update(self.__dict__)
+        return new_obj
 
     def operator_type(self):
         '''
@@ -102,17 +111,29 @@ class Expression:
             ret = [x for x in ret if x.type != 'Space']
         return ret
 
+    def clear_cache(self):
+        '''
+        Invalidate any cached string representations
+
+        Must be called whenever the expression is modified after the setters have been called
+        '''
+        self._repr = None
+
     def regen_str(self):
         '''
         Re-construct the string based off the original set of tokens
 
         <lparam><operator><rparam>;
+
+        The original tokens never change, so the string is only built once
         '''
-        return "{0}{1}{2};".format(
-            self.lparam_token.value,
-            self.operator_token.value,
-            self.rparam_token.value,
-        )
+        if self._regen_str is None:
+            self._regen_str = "{0}{1}{2};".format(
+                self.lparam_token.value,
+                self.operator_token.value,
+                self.rparam_token.value,
+            )
+        return self._regen_str
 
     def point_chars(self, pos_list):
         '''
@@ -125,17 +146,17 @@ class Expression:
         > U"A" : : U"1";
         >        ^
         '''
-        out = "\t{0}\n\t".format(self.regen_str())
+        pointers = []
 
         # Place a ^ character at the given locations
         curpos = 1
         for pos in sorted(pos_list):
             # Pad spaces, then add a ^
-            out += ' ' * (pos - curpos)
-            out += '^'
-            curpos += pos
+            pointers.append(' ' * (pos - curpos))
+            pointers.append('^')
+            curpos = pos + 1
 
-        return out
+        return "\t{0}\n\t{1}".format(self.regen_str(), "".join(pointers))
 
     def rparam_start(self):
         '''
@@ -209,7 +230,7 @@ class AssignmentExpression(Expression):
 
         # If pos is not none, flatten
         if pos is not None:
-            self.value = "".join(str(x) for x in self.value)
+            self.value = "".join(map(str, self.value))
 
         return True
 
@@ -259,7 +280,7 @@ class AssignmentExpression(Expression):
         self.value = value
 
         # Flatten value, often a list of various token types
-        self.value = "".join(str(x) for x in self.value)
+        self.value = "".join(map(str, self.value))
 
         return True
 
@@ -348,7 +369,7 @@ class NameAssociationExpression(Expression):
 
         May not look like the original expression if simplication has taken place
         '''
-        return "{0}".format(self)
+        return str(self)
 
     def unique_keys(self):
         '''
@@ -366,6 +387,9 @@ class DataAssociationExpression(Expression):
     association = None
     value = None
 
+    # Expression types that associate positions with identifiers
+    position_types = frozenset(['PixelPosition', 'ScanCodePosition'])
+
     ## Setters ##
     def animation(self, animations, animation_modifiers):
         '''
@@ -429,19 +453,13 @@ class DataAssociationExpression(Expression):
 
         @param new_expression: Expression used to update this one
         '''
-        supported = ['PixelPosition', 'ScanCodePosition']
-        if new_expression.type in supported:
+        if new_expression.type in self.position_types:
             for scancode in self.association:
                 scancode.updatePositions(new_expression.association[0])
 
     def __repr__(self):
-        if self.type in ['PixelPosition', 'ScanCodePosition']:
-            output = ""
-            for index, association in enumerate(self.association):
-                if index > 0:
-                    output += "; "
-                output += "{0}".format(association)
-            return "{0};".format(output)
+        if self.type in self.position_types:
+            return "{0};".format("; ".join(str(association) for association in self.association))
         return "{0} <= {1};".format(self.association, self.value)
 
     def kllify(self):
@@ -453,7 +471,7 @@ class DataAssociationExpression(Expression):
         __repr__ is formatted correctly with assignment expressions
         '''
 
-        if self.type in ['PixelPosition', 'ScanCodePosition']:
+        if self.type in self.position_types:
             output = ""
             for index, association in enumerate(self.association):
                 if index > 0:
@@ -461,7 +479,7 @@ class DataAssociationExpression(Expression):
                 output += "{0}".format(association.kllify())
             return "{0};".format(output)
 
-        if self.type in ['AnimationFrame']:
+        if self.type == 'AnimationFrame':
             output = "{0} <= ".format(self.association[0].kllify())
             for index, association in enumerate(self.value):
                 if index > 0:
@@ -483,7 +501,7 @@ class DataAssociationExpression(Expression):
         keys = []
 
         # Positions require a bit more introspection to get the unique keys
-        if self.type in ['PixelPosition', 'ScanCodePosition']:
+        if self.type in self.position_types:
             for index, key in enumerate(self.association):
                 uniq_expr = self
 
@@ -499,7 +517,7 @@ class DataAssociationExpression(Expression):
 
         # AnimationFrames are already list of keys
         # TODO Reorder frame assignments to dedup function equivalent mappings
-        elif self.type in ['AnimationFrame']:
+        elif self.type == 'AnimationFrame':
             for index, key in enumerate(self.association):
                 uniq_expr = self
 
@@ -517,10 +535,10 @@ class DataAssociationExpression(Expression):
         else:
             keys = [("{0}".format(self.association), self)]
 
-        # Remove any duplicate keys
+        # Remove any duplicate keys, preserving the order they were generated in
         # TODO Stat? Might be at neat report about how many duplicates were
         # squashed
-        keys = list(set(keys))
+        keys = list(dict.fromkeys(keys))
 
         return keys
 
@@ -556,6 +574,8 @@ class MapExpression(Expression): # lgtm [py/missing-call-to-init]
 
         self.connect_id = 0
 
+        self.clear_cache()
+
     ## Setters ##
     def triggerCode(self, triggers, operator, results):
         '''
@@ -572,6 +592,7 @@ class MapExpression(Expression): # lgtm [py/missing-call-to-init]
         self.triggers = triggers
         self.operator = operator
         self.results = results
+        self.clear_cache()
 
         return True
 
@@ -584,9 +605,21 @@ class MapExpression(Expression): # lgtm [py/missing-call-to-init]
         self.type = 'PixelChannel'
         self.pixel = pixelmap
         self.position = trigger
+        self.clear_cache()
 
         return True
 
+    def clear_cache(self):
+        '''
+        Invalidate any cached string representations and element counts
+
+        Must be called whenever the triggers or results are modified in place
+        '''
+        self._repr = None
+        self._trigger_str = None
+        self._result_str = None
+        self._elems = None
+
     def triggersSequenceOfCombosOfIds(self, index=0):
         '''
         Takes triggers and converts into explicit ids
@@ -631,33 +664,19 @@ class MapExpression(Expression): # lgtm [py/missing-call-to-init]
         Scan Code Example
         [[[S10, S16], [S42]], [[S11, S16], [S42]]] -> (S10 + S16, S42)|(S11 + S16, S42)
         '''
-        output = ""
-
         # Sometimes during error cases, might be None
         if expression_param is None:
-            return output
+            return ""
 
         # Iterate over each trigger/result variants (expanded from ranges),
-        # each one is a sequence
-        for index, sequence in enumerate(expression_param):
-            if index > 0:
-                output += "|"
-            output += "("
-
-            # Iterate over each combo (element of the sequence)
-            for index, combo in enumerate(sequence):
-                if index > 0:
-                    output += ", "
-
-                # Iterate over each trigger identifier
-                for index, identifier in enumerate(combo):
-                    if index > 0:
-                        output += " + "
-                    output += "{0}".format(identifier)
-
-            output += ")"
-
-        return output
+        # each one is a sequence of combos of identifiers
+        return "|".join(
+            "({0})".format(", ".join(
+                " + ".join(str(identifier) for identifier in combo)
+                for combo in sequence
+            ))
+            for sequence in expression_param
+        )
 
     def sequencesOfCombosOfIds_kll(self, expression_param):
         '''
@@ -765,6 +784,10 @@ class MapExpression(Expression): # lgtm [py/missing-call-to-init]
         for identifier in self.trigger_id_list():
             if identifier.type == 'ScanCode':
                 identifier.updated_uid = identifier.uid + offset
+                identifier.clear_cache()
+
+        # ScanCode uids are part of the string representation
+        self.clear_cache()
 
     def elems(self):
         '''
@@ -775,66 +798,68 @@ class MapExpression(Expression): # lgtm [py/missing-call-to-init]
 
         @return: ( triggers, results )
         '''
-        elems = [0, 0]
+        if self._elems is not None:
+            return self._elems
 
         # XXX Needed?
         if self.type == 'PixelChannel':
-            return tuple(elems)
-
-        # Iterate over each trigger variant (expanded from ranges), each one is
-        # a sequence
-        for sequence in self.triggers:
-            # Iterate over each combo (element of the sequence)
-            for combo in sequence:
-                # Just measure the size of the combo
-                elems[0] += len(combo)
-
-        # Iterate over each result variant (expanded from ranges), each one is
-        # a sequence
-        for sequence in self.results:
-            # Iterate over each combo (element of the sequence)
-            for combo in sequence:
-                # Just measure the size of the combo
-                elems[1] += len(combo)
+            self._elems = (0, 0)
+            return self._elems
 
-        return tuple(elems)
+        # Measure the size of each combo, in each sequence of each variant (expanded from ranges)
+        self._elems = (
+            sum(len(combo) for sequence in self.triggers for combo in sequence),
+            sum(len(combo) for sequence in self.results for combo in sequence),
+        )
+        return self._elems
 
     def trigger_str(self):
         '''
         String version of the trigger
         Used for sorting
         '''
+        if self._trigger_str is not None:
+            return self._trigger_str
+
         # Pixel Channel Mapping doesn't follow the same pattern
         if self.type == 'PixelChannel':
-            return "{0}".format(self.pixel)
+            self._trigger_str = str(self.pixel)
+        else:
+            self._trigger_str = self.sequencesOfCombosOfIds(self.triggers)
 
-        return "{0}".format(
-            self.sequencesOfCombosOfIds(self.triggers),
-        )
+        return self._trigger_str
 
     def result_str(self):
         '''
         String version of the result
         Used for sorting
         '''
+        if self._result_str is not None:
+            return self._result_str
+
         # Pixel Channel Mapping doesn't follow the same pattern
         if self.type == 'PixelChannel':
-            return "{0}".format(self.position)
+            self._result_str = str(self.position)
+        else:
+            self._result_str = self.sequencesOfCombosOfIds(self.results)
 
-        return "{0}".format(
-            self.sequencesOfCombosOfIds(self.results),
-        )
+        return self._result_str
 
     def __repr__(self):
+        if self._repr is not None:
+            return self._repr
+
         # Pixel Channel Mapping doesn't follow the same pattern
         if self.type == 'PixelChannel':
-            return "{0} : {1};".format(self.pixel, self.position)
+            self._repr = "{0} : {1};".format(self.pixel, self.position)
+        else:
+            self._repr = "{0} {1} {2};".format(
+                self.trigger_str(),
+                self.operator,
+                self.result_str(),
+            )
 
-        return "{0} {1} {2};".format(
-            self.sequencesOfCombosOfIds(self.triggers),
-            self.operator,
-            self.sequencesOfCombosOfIds(self.results),
-        )
+        return self._repr
 
     def sort_trigger(self):
         '''
@@ -902,7 +927,6 @@ class MapExpression(Expression): # lgtm [py/missing-call-to-init]
             # Iterate over each trigger/result variants (expanded from ranges),
             # each one is a sequence
             for index, sequence in enumerate(self.triggers):
-                key = ""
                 uniq_expr = self
 
                 # If there is more than one key, copy the expression
@@ -912,24 +936,57 @@ class MapExpression(Expression): # lgtm [py/missing-call-to-init]
 
                     # Isolate variant by index
                     uniq_expr.triggers = [uniq_expr.triggers[index]]
+                    uniq_expr.clear_cache()
 
-                # Iterate over each combo (element of the sequence)
-                for index, combo in enumerate(sequence):
-                    if index > 0:
-                        key += ", "
-
-                    # Iterate over each trigger identifier
-                    for index, identifier in enumerate(combo):
-                        if index > 0:
-                            key += " + "
-                        key += "{0} {1}".format(self.connect_id, identifier)
+                # Iterate over each combo (element of the sequence) and each trigger identifier
+                key = ", ".join(
+                    " + ".join(
+                        "{0} {1}".format(self.connect_id, identifier)
+                        for identifier in combo
+                    )
+                    for combo in sequence
+                )
 
                 # Add key to list
                 keys.append((key, uniq_expr))
 
-        # Remove any duplicate keys
+        # Remove any duplicate keys, preserving the order they were generated in
         # TODO Stat? Might be at neat report about how many duplicates were
         # squashed
-        keys = list(set(keys))
+        keys = list(dict.fromkeys(keys))
 
         return keys
+
+
+
+### Functions ###
+
+# Expression class for each base operator, see Expression.operator_type
+expression_types = {
+    '=>': NameAssociationExpression,
+    '<=': DataAssociationExpression,
+    '=': AssignmentExpression,
+    ':': MapExpression,
+}
+
+
+def make_expression(lparam, operator, rparam, context):
+    '''
+    Build an expression container of the type matching the operator
+
+    All : (map) operators share the MapExpression type
+
+    @param lparam:   LOperatorData token
+    @param operator: Operator token
+    @param rparam:   ROperatorData token
+    @param context:  Parent context of expression
+
+    @return: Initialized Expression subclass
+    '''
+    base_operator = ':' if ':' in operator.value else operator.value
+    expression_class = expression_types[base_operator]
+
+    # MapExpression has its own constructor for reduction, always use the base initializer
+    expr = expression_class.__new__(expression_class)
+    Expression.__init__(expr, lparam, operator, rparam, context)
+    return expr
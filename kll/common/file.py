@@ -93,11 +93,12 @@ class KLLFile:
         '''
         try:
             # Read file into memory, removing newlines
-            with open(self.path) as f:
+            # Text mode is kept so that \r\n line endings are normalized
+            with open(self.path, encoding='utf-8') as f:
                 self.data = f.read()
-                self.lines = self.data.splitlines()
+            self.lines = self.data.splitlines()
 
-        except Exception:
+        except (OSError, UnicodeDecodeError):
             print(
                 "{0} Failed to read '{1}' into memory...".format(
                     ERROR, self.path))
@@ -35,6 +35,42 @@ from kll.extern.funcparserlib.parser import NoParseError
 ERROR = '\033[5;1;31mERROR\033[0m:'
 WARNING = '\033[5;1;33mWARNING\033[0m:'
 
+# HID uid to name dictionaries, keyed by (layout name, locale table)
+# A new layout object is loaded for every kll file, keying on the name shares the dictionaries between them
+# and keeps the cache to one entry per layout name and HID type
+hid_name_cache = {}
+
+
+def pixel_address_dispatch(mask):
+    '''
+    Determine the PixelAddressType and uid set builder for a field mask
+
+    @param mask: Bitmask of set fields, index(16) col(8) row(4) relCol(2) relRow(1)
+
+    @returns: (inferred type, uid set function), (None, None) if no fields are set
+    '''
+    if mask & 16:
+        return ('PixelAddressId_Index', lambda address: (address.index,))
+    if mask & 12:
+        types = {
+            8: 'PixelAddressId_ColumnFill',
+            4: 'PixelAddressId_RowFill',
+            12: 'PixelAddressId_Rect',
+        }
+        return (types[mask & 12], lambda address: (address.col, address.row))
+    if mask & 3:
+        types = {
+            2: 'PixelAddressId_RelativeColumnFill',
+            1: 'PixelAddressId_RelativeRowFill',
+            3: 'PixelAddressId_RelativeRect',
+        }
+        return (types[mask & 3], lambda address: (address.relCol, address.relRow))
+    return (None, None)
+
+
+# PixelAddressId lookup tables, indexed by PixelAddressId.field_mask()
+pixel_address_types, pixel_address_uid_sets = zip(*[pixel_address_dispatch(mask) for mask in range(32)])
+
 
 
 ### Classes ###
@@ -42,12 +78,29 @@ WARNING = '\033[5;1;33mWARNING\033[0m:'
 class Id(object):
     '''
     Base container class for various KLL types
+
+    Subclasses that mix in Schedule, Position or the modifier/channel lists keep an
+    instance __dict__, the remaining leaf classes declare their own __slots__.
     '''
+    __slots__ = ('type', 'uid', '_repr', '_kllify')
 
     def __init__(self):
         self.type = None
         self.uid = None
 
+        # Cached string representations, see clear_cache
+        self._repr = None
+        self._kllify = None
+
+    def clear_cache(self):
+        '''
+        Invalidate any cached string representations
+
+        Must be called whenever a field used by __repr__ or kllify is modified
+        '''
+        self._repr = None
+        self._kllify = None
+
     def get_uid(self):
         '''
         Some Id types have alternate uid mappings
@@ -71,39 +124,20 @@ class Id(object):
 
         In most cases we can just the string representation of the object
         '''
-        return "{0}".format(self)
+        return str(self)
 
 
 class HIDId(Id, Schedule):
     '''
     HID/USB identifier container class
     '''
-    secondary_types = {
-        'USBCode': 'USB',
-        'SysCode': 'SYS',
-        'ConsCode': 'CONS',
-        'IndCode': 'IND',
-    }
-
-    kll_types = {
-        'USBCode': 'U',
-        'SysCode': 'SYS',
-        'ConsCode': 'CONS',
-        'IndCode': 'I',
-    }
-
-    type_width = {
-        'USBCode': 1,
-        'SysCode': 1,
-        'ConsCode': 2,
-        'IndCode': 1,
-    }
-
-    type_locale = {
-        'USBCode': 'to_hid_keyboard',
-        'SysCode': 'to_hid_sysctrl',
-        'ConsCode': 'to_hid_consumer',
-        'IndCode': 'to_hid_led',
+    # Per-type attributes, looked up once during construction
+    # (secondary type, kll type, byte width, hex_str padding, locale table)
+    type_attributes = {
+        'USBCode': ('USB', 'U', 1, 2, 'to_hid_keyboard'),
+        'SysCode': ('SYS', 'SYS', 1, 2, 'to_hid_sysctrl'),
+        'ConsCode': ('CONS', 'CONS', 2, 3, 'to_hid_consumer'),
+        'IndCode': ('IND', 'I', 1, 2, 'to_hid_led'),
     }
 
     def __init__(self, type, uid, locale):
@@ -117,21 +151,23 @@ class HIDId(Id, Schedule):
         self.type = type
         self.uid = uid
         self.locale = locale
-        self.locale_type = self.type_locale[self.type]
 
-        # Set secondary type
-        self.second_type = self.secondary_types[self.type]
+        # Cached schedule suffix, see scheduleSuffix
+        self._sched_suffix = None
 
-        # Set kll type
-        self.kll_type = self.kll_types[self.type]
-
-        # Determine hex_str padding
-        self.padding = 2
-        if self.type == 'ConsCode':
-            self.padding = 3
+        # Set secondary type, kll type, width, hex_str padding and locale table
+        (
+            self.second_type,
+            self.kll_type,
+            self._width,
+            self.padding,
+            self.locale_type,
+        ) = self.type_attributes[self.type]
 
         # Validate uid is in locale based on what type of HID field it is
-        if self.hex_str() not in self.locale.json()[self.locale_type].keys():
+        # The uid and locale never change, so keep the name for __repr__
+        self._name = self.name_lookup().get(self.uid)
+        if self._name is None:
             print("{} Unknown HID({}) UID('{}') in locale '{}'".format(
                 WARNING,
                 self.type,
@@ -139,6 +175,27 @@ class HIDId(Id, Schedule):
                 self.locale.name()
             ))
 
+    def name_lookup(self):
+        '''
+        Returns the uid to name dictionary for this locale and HID type
+
+        Only locale entries keyed exactly as hex_str() would format them are included.
+        Built once per layout name and HID type.
+        '''
+        key = (self.locale.name(), self.locale_type)
+        lookup = hid_name_cache.get(key)
+        if lookup is None:
+            lookup = {}
+            for hex_key, name in self.locale.json()[self.locale_type].items():
+                try:
+                    uid = int(hex_key, 16)
+                except ValueError:
+                    continue
+                if "0x{0:0{1}X}".format(uid, self.padding) == hex_key:
+                    lookup[uid] = name
+            hid_name_cache[key] = lookup
+        return lookup
+
     def hex_str(self):
         '''
         Returns hex string used by locale for uid lookup
@@ -158,27 +215,49 @@ class HIDId(Id, Schedule):
         This is the maximum number of bytes required for each type of HIDId as per the USB spec.
         Generally this is just 1 byte, however, Consumer elements (ConsCode) requires 2 bytes.
         '''
-        return self.type_width[self.type]
+        return self._width
+
+    def clear_cache(self):
+        '''
+        Invalidate any cached string representations, including the schedule suffix
+        '''
+        Id.clear_cache(self)
+        self._sched_suffix = None
+
+    def scheduleSuffix(self):
+        '''
+        Parenthesized schedule appended to __repr__ and kllify, empty if there is no schedule
+        '''
+        if self._sched_suffix is None:
+            schedule = self.strSchedule()
+            self._sched_suffix = "({0})".format(schedule) if schedule else ""
+        return self._sched_suffix
 
     def name(self):
         '''
         Return a human readable name from the current locale
         '''
-
-        return self.locale.json()[self.locale_type][self.hex_str()]
+        if self._name is None:
+            raise KeyError(self.hex_str())
+        return self._name
 
     def __repr__(self):
         '''
         Use string name instead of integer, easier to debug
         '''
+        if self._repr is not None:
+            return self._repr
+
         try:
             name = self.name()
-            schedule = self.strSchedule()
-            if len(schedule) > 0:
-                schedule = "({0})".format(schedule)
-
-            output = 'HID({},{})"{}"{}{}'.format(self.type, self.locale.name(), self.uid, name, schedule)
-            return output
+            self._repr = 'HID({},{})"{}"{}{}'.format(
+                self.type,
+                self.locale.name(),
+                self.uid,
+                name,
+                self.scheduleSuffix(),
+            )
+            return self._repr
         except Exception:
             print("{} '{}' is an invalid dictionary lookup.".format(
                 WARNING,
@@ -186,6 +265,16 @@ class HIDId(Id, Schedule):
             ))
             return "<INVALID>"
 
+    def pixel_key(self, kll=False):
+        '''
+        Returns the PixelId key string when used as a pixel uid
+
+        @param kll: Kll output format mode
+        '''
+        if kll:
+            return self.kllify()
+        return "P[{0}]".format(self)
+
     def json(self):
         '''
         JSON representation of HIDId
@@ -198,12 +287,11 @@ class HIDId(Id, Schedule):
         '''
         Returns KLL version of the Id
         '''
-        schedule = self.strSchedule()
-        if len(schedule) > 0:
-            schedule = "({0})".format(schedule)
+        if self._kllify is not None:
+            return self._kllify
 
-        output = "{0}{1:#05x}{2}".format(self.kll_type, self.uid, schedule)
-        return output
+        self._kllify = "{0}{1:#05x}{2}".format(self.kll_type, self.uid, self.scheduleSuffix())
+        return self._kllify
 
 
 class ScanCodeId(Id, Schedule, Position):
@@ -249,20 +337,33 @@ class ScanCodeId(Id, Schedule, Position):
         '''
         Returns the key string used for datastructure sorting
         '''
-        # Positions are a special case
-        if self.positionSet():
-            return "S{0:03d}".format(self.get_uid())
+        return "S{0:03d}".format(self.get_uid())
 
     def __repr__(self):
+        if self._repr is not None:
+            return self._repr
+
         # Positions are a special case
         if self.positionSet():
-            return "{0} <= {1}".format(self.unique_key(), self.strPosition())
+            self._repr = "{0} <= {1}".format(self.unique_key(), self.strPosition())
+            return self._repr
 
         schedule = self.strSchedule()
         if len(schedule) > 0:
-            return "S{0:03d}({1})".format(self.get_uid(), schedule)
+            self._repr = "S{0:03d}({1})".format(self.get_uid(), schedule)
         else:
-            return "S{0:03d}".format(self.get_uid())
+            self._repr = "S{0:03d}".format(self.get_uid())
+        return self._repr
+
+    def pixel_key(self, kll=False):
+        '''
+        Returns the PixelId key string when used as a pixel uid
+
+        @param kll: Kll output format mode
+        '''
+        if kll:
+            return self.kllify()
+        return "P[{0}]".format(self)
 
     def json(self):
         '''
@@ -277,6 +378,9 @@ class ScanCodeId(Id, Schedule, Position):
         '''
         Returns KLL version of the Id
         '''
+        if self._kllify is not None:
+            return self._kllify
+
         schedule = self.strSchedule()
         if len(schedule) > 0:
             schedule = "({0})".format(schedule)
@@ -286,6 +390,8 @@ class ScanCodeId(Id, Schedule, Position):
         # Position enabled
         if self.isPositionSet():
             output += " <= {0}".format(self.strPosition())
+
+        self._kllify = output
         return output
 
 
@@ -301,18 +407,22 @@ class LayerId(Id, Schedule):
         self.uid = layer
 
     def __repr__(self):
+        if self._repr is not None:
+            return self._repr
+
         schedule = self.strSchedule()
         if len(schedule) > 0:
-            return "{0}[{1}]({2})".format(
+            self._repr = "{0}[{1}]({2})".format(
                 self.type,
                 self.uid,
                 schedule,
             )
         else:
-            return "{0}[{1}]".format(
+            self._repr = "{0}[{1}]".format(
                 self.type,
                 self.uid,
             )
+        return self._repr
 
     def width(self):
         '''
@@ -351,16 +461,20 @@ class TriggerId(Id, Schedule):
         self.idcode = idcode
 
     def __repr__(self):
+        if self._repr is not None:
+            return self._repr
+
         schedule = self.strSchedule()
         schedule_val = ""
         if len(schedule) > 0:
             schedule_val = "({})".format(schedule)
 
-        return "T[{0},{1}]{2}".format(
+        self._repr = "T[{0},{1}]{2}".format(
             self.idcode,
             self.uid,
             schedule_val,
         )
+        return self._repr
 
     def json(self):
         '''
@@ -401,7 +515,7 @@ class AnimationId(Id, Schedule, AnimationModifierList):
         schedule = self.strSchedule()
         if len(schedule) > 0:
             return "A[{0}{1}]({2})".format(self.name, state, self.strSchedule())
-        if len(self.modifiers) > 0:
+        if self.modifiers:
             return "A[{0}{1}]({2})".format(self.name, state, self.strModifiers())
         return self.base_repr()
 
@@ -477,15 +591,10 @@ class PixelId(Id, Position, PixelModifierList, ChannelList):
 
         @param kll: Kll output format mode
         '''
-        if isinstance(self.uid, HIDId) or isinstance(self.uid, ScanCodeId):
-            if kll:
-                return "{0}".format(self.uid.kllify())
-            return "P[{0}]".format(self.uid)
-
-        if isinstance(self.uid, PixelAddressId):
-            if kll:
-                return "P[{0}]".format(self.uid.kllify())
-            return "P[{0}]".format(self.uid)
+        # HIDId, ScanCodeId and PixelAddressId know how to format themselves
+        pixel_key = getattr(self.uid, 'pixel_key', None)
+        if pixel_key is not None:
+            return pixel_key(kll)
 
         if kll:
             return "P{0:#05x}".format(self.uid)
@@ -498,7 +607,7 @@ class PixelId(Id, Position, PixelModifierList, ChannelList):
             return "{0} <= {1}".format(self.unique_key(), self.strPosition())
 
         extra = ""
-        if len(self.modifiers) > 0:
+        if self.modifiers:
             extra += "({0})".format(self.strModifiers())
         if len(self.channels) > 0:
             extra += "({0})".format(self.strChannels())
@@ -513,7 +622,7 @@ class PixelId(Id, Position, PixelModifierList, ChannelList):
             return "{0} <= {1}".format(self.unique_key(kll=True), self.strPosition())
 
         extra = ""
-        if len(self.modifiers) > 0:
+        if self.modifiers:
             extra += "({0})".format(self.strModifiers())
         if len(self.channels) > 0:
             extra += "({0})".format(self.strChannels())
@@ -524,6 +633,16 @@ class PixelAddressId(Id):
     '''
     Pixel address identifier container class
     '''
+    __slots__ = ('index', 'col', 'row', 'relCol', 'relRow', '_mask')
+
+    # outputStrList field order, (attribute, prefix, relative)
+    output_fields = (
+        ('index', '', False),
+        ('row', 'r:', False),
+        ('col', 'c:', False),
+        ('relRow', 'r:i', True),
+        ('relCol', 'c:i', True),
+    )
 
     def __init__(self, index=None, col=None, row=None, relCol=None, relRow=None):
         Id.__init__(self)
@@ -540,50 +659,40 @@ class PixelAddressId(Id):
 
         self.type = 'PixelAddress'
 
+        # Which fields are set, index into the pixel address lookup tables
+        self._mask = self.field_mask()
+
+    def field_mask(self):
+        '''
+        Bitmask of the set address fields, index(16) col(8) row(4) relCol(2) relRow(1)
+        '''
+        return (
+            (0 if self.index is None else 16) |
+            (0 if self.col is None else 8) |
+            (0 if self.row is None else 4) |
+            (0 if self.relCol is None else 2) |
+            (0 if self.relRow is None else 1)
+        )
+
     def inferred_type(self):
         '''
         Determine which PixelAddressType based on set values
         '''
-
-        if self.index is not None:
-            return 'PixelAddressId_Index'
-        if self.col is not None and self.row is None:
-            return 'PixelAddressId_ColumnFill'
-        if self.col is None and self.row is not None:
-            return 'PixelAddressId_RowFill'
-        if self.col is not None and self.row is not None:
-            return 'PixelAddressId_Rect'
-        if self.relCol is not None and self.relRow is None:
-            return 'PixelAddressId_RelativeColumnFill'
-        if self.relCol is None and self.relRow is not None:
-            return 'PixelAddressId_RelativeRowFill'
-        if self.relCol is not None and self.relRow is not None:
-            return 'PixelAddressId_RelativeRect'
-
-        print("{0} Unknown PixelAddressId, this is a bug!".format(ERROR))
-        return "<UNKNOWN PixelAddressId>"
+        inferred = pixel_address_types[self._mask]
+        if inferred is None:
+            print("{0} Unknown PixelAddressId, this is a bug!".format(ERROR))
+            return "<UNKNOWN PixelAddressId>"
+        return inferred
 
     def uid_set(self):
         '''
         Returns a tuple of uids, depends on what has been set.
         '''
-        if self.index is not None:
-            return tuple([self.index])
-        if self.col is not None and self.row is None:
-            return tuple([self.col, self.row])
-        if self.col is None and self.row is not None:
-            return tuple([self.col, self.row])
-        if self.col is not None and self.row is not None:
-            return tuple([self.col, self.row])
-        if self.relCol is not None and self.relRow is None:
-            return tuple([self.relCol, self.relRow])
-        if self.relCol is None and self.relRow is not None:
-            return tuple([self.relCol, self.relRow])
-        if self.relCol is not None and self.relRow is not None:
-            return tuple([self.relCol, self.relRow])
-
-        print("{0} Unknown uid set, this is a bug!".format(ERROR))
-        return "<UNKNOWN uid set"
+        builder = pixel_address_uid_sets[self._mask]
+        if builder is None:
+            print("{0} Unknown uid set, this is a bug!".format(ERROR))
+            return "<UNKNOWN uid set"
+        return builder(self)
 
     def merge(self, address):
         '''
@@ -616,6 +725,10 @@ class PixelAddressId(Id):
         if not address.relRow is None:
             self.relRow = address.relRow
 
+        # Address fields are part of the string representation and lookup mask
+        self._mask = self.field_mask()
+        self.clear_cache()
+
     def valueStr(self, value):
         '''
         Prepare numerical value based on type
@@ -643,35 +756,37 @@ class PixelAddressId(Id):
         output = []
 
         # Construct representation
-        if not self.index is None:
-            output.append("{0}".format(self.valueStr(self.index)))
-        if not self.row is None:
-            cur_out = "r:{0}".format(self.valueStr(self.row))
-            output.append(cur_out)
-        if not self.col is None:
-            cur_out = "c:{0}".format(self.valueStr(self.col))
-            output.append(cur_out)
-        if not self.relRow is None:
-            cur_out = "r:i"
-            cur_out += self.relRow >= 0 and "+" or ""
-            cur_out += "{0}".format(self.valueStr(self.relRow))
-            output.append(cur_out)
-        if not self.relCol is None:
-            cur_out = "c:i"
-            cur_out += self.relCol >= 0 and "+" or ""
-            cur_out += "{0}".format(self.valueStr(self.relCol))
-            output.append(cur_out)
+        for name, prefix, relative in self.output_fields:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            sign = "+" if relative and value >= 0 else ""
+            output.append("{0}{1}{2}".format(prefix, sign, self.valueStr(value)))
 
         return output
 
+    def pixel_key(self, kll=False):
+        '''
+        Returns the PixelId key string when used as a pixel uid
+
+        @param kll: Kll output format mode
+        '''
+        if kll:
+            return "P[{0}]".format(self.kllify())
+        return "P[{0}]".format(self)
+
     def __repr__(self):
-        return "{0}".format(self.outputStrList())
+        if self._repr is None:
+            self._repr = "{0}".format(self.outputStrList())
+        return self._repr
 
     def kllify(self):
         '''
         KLL syntax compatible output for PixelAddress object
         '''
-        return ",".join(self.outputStrList())
+        if self._kllify is None:
+            self._kllify = ",".join(self.outputStrList())
+        return self._kllify
 
 
 class PixelLayerId(Id, PixelModifierList):
@@ -686,7 +801,7 @@ class PixelLayerId(Id, PixelModifierList):
         self.type = 'PixelLayer'
 
     def __repr__(self):
-        if len(self.modifiers) > 0:
+        if self.modifiers:
             return "PL{0}({1})".format(self.uid, self.strModifiers())
         return "PL{0}".format(self.uid)
 
@@ -695,27 +810,34 @@ class CapId(Id):
     '''
     Capability identifier
     '''
+    __slots__ = ('name', 'arg_list', '_total_arg_bytes')
 
-    def __init__(self, name, type, arg_list=[]):
+    def __init__(self, name, type, arg_list=None):
         '''
         @param name:     Name of capability
         @param type:     Type of capability definition, string
-        @param arg_list: List of CapArgIds, empty list if there are none
+        @param arg_list: List of CapArgIds, None if there are none
         '''
         Id.__init__(self)
         self.name = name
         self.type = type
-        self.arg_list = arg_list
+
+        # Arguments are fixed once the capability is defined
+        self.arg_list = () if arg_list is None else tuple(arg_list)
+
+        # Cached sum of the explicitly set argument widths, see total_arg_bytes
+        self._total_arg_bytes = None
 
     def __repr__(self):
+        # Name and arguments do not change after initialization
+        if self._repr is not None:
+            return self._repr
+
         # Generate prettified argument list
-        arg_string = ""
-        for arg in self.arg_list:
-            arg_string += "{0},".format(arg)
-        if len(arg_string) > 0:
-            arg_string = arg_string[:-1]
+        arg_string = ",".join(str(arg) for arg in self.arg_list)
 
-        return "{0}({1})".format(self.name, arg_string)
+        self._repr = "{0}({1})".format(self.name, arg_string)
+        return self._repr
 
     def json(self):
         '''
@@ -733,13 +855,30 @@ class CapId(Id):
 
         @param capabilities_dict: Dictionary of capabilities used, just in case no widths have been assigned
 
+        return: Number of bytes
+        '''
+        # Widths may need to be looked up in the capabilities dictionary
+        if capabilities_dict is not None:
+            return self.resolve_arg_bytes(capabilities_dict)
+
+        # Set widths never change, only sum them once
+        if self._total_arg_bytes is None:
+            self._total_arg_bytes = sum(arg.width for arg in self.arg_list)
+        return self._total_arg_bytes
+
+    def resolve_arg_bytes(self, capabilities_dict):
+        '''
+        Sum the argument widths, looking up any unset widths in the capabilities dictionary
+
+        @param capabilities_dict: Dictionary of capabilities used
+
         return: Number of bytes
         '''
         # Zero if no args
         total_bytes = 0
         for index, arg in enumerate(self.arg_list):
             # Lookup actual width if necessary (wasn't set explicitly)
-            if capabilities_dict is not None and (arg.type == 'CapArgValue' or arg.width is None):
+            if arg.type == 'CapArgValue' or arg.width is None:
                 # Check if there are enough arguments
                 expected = len(capabilities_dict[self.name].association.arg_list)
                 got = len(self.arg_list)
@@ -787,10 +926,15 @@ class UTF8Id(Id, Schedule):
         self.uid = ustr
 
     def __repr__(self):
+        if self._repr is not None:
+            return self._repr
+
         schedule = self.strSchedule()
         if schedule:
-            return "u'{0}'({1})".format(self.uid, schedule)
-        return "u'{0}'".format(self.uid)
+            self._repr = "u'{0}'({1})".format(self.uid, schedule)
+        else:
+            self._repr = "u'{0}'".format(self.uid)
+        return self._repr
 
     def width(self):
         '''
@@ -815,14 +959,19 @@ class UTF8Id(Id, Schedule):
         For single characters, use code point format (U+123A)
         For multiple characters, use a UTF-8 string
         '''
+        if self._kllify is not None:
+            return self._kllify
+
         unicode_output = "u'{}'".format(self.uid)
         if len(self.uid) == 1:
             unicode_output = "U+{:X}".format(ord(self.uid[0]))
 
         schedule = self.strSchedule()
         if schedule:
-            return "{0}({1})".format(unicode_output, schedule)
-        return "{0}".format(unicode_output)
+            unicode_output = "{0}({1})".format(unicode_output, schedule)
+
+        self._kllify = unicode_output
+        return self._kllify
 
 
 class NoneId(CapId):
@@ -831,6 +980,7 @@ class NoneId(CapId):
 
     It's just a capability...that does nothing (instead of infering to do something else)
     '''
+    __slots__ = ()
 
     def __init__(self):
         super().__init__('None', 'None')
@@ -851,6 +1001,7 @@ class CapArgId(Id):
     '''
     Capability Argument identifier
     '''
+    __slots__ = ('name', 'width')
 
     def __init__(self, name, width=None):
         '''
@@ -864,7 +1015,7 @@ class CapArgId(Id):
 
     def __repr__(self):
         if self.width is None:
-            return "{0}".format(self.name)
+            return str(self.name)
         else:
             return "{0}:{1}".format(self.name, self.width)
 
@@ -883,6 +1034,7 @@ class CapArgValue(Id):
     '''
     Capability Argument Value identifier
     '''
+    __slots__ = ('value',)
 
     def __init__(self, value):
         '''
@@ -893,7 +1045,7 @@ class CapArgValue(Id):
         self.type = 'CapArgValue'
 
     def __repr__(self):
-        return "{}".format(self.value)
+        return str(self.value)
 
     def json(self):
         '''
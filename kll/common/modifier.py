@@ -28,6 +28,16 @@ KLL Modifier Containers
 ERROR = '\033[5;1;31mERROR\033[0m:'
 WARNING = '\033[5;1;33mWARNING\033[0m:'
 
+# PixelModifier operator to operator type
+pixel_operator_types = {
+    None: 'Set',
+    '+': 'Add',
+    '-': 'Subtract',
+    '+:': 'NoRoll_Add',
+    '-:': 'NoRoll_Subtract',
+    '<<': 'LeftShift',
+    '>>': 'RightShift',
+}
 
 
 ### Classes ###
@@ -36,6 +46,7 @@ class AnimationModifierArg:
     '''
     Animation modification arg container class
     '''
+    __slots__ = ('parent', 'arg', 'subarg')
 
     def __init__(self, parent, value):
         self.parent = parent
@@ -134,13 +145,15 @@ class AnimationModifierArg:
 
         In most cases we can just the string representation of the object
         '''
-        return "{0}".format(self)
+        return str(self)
 
 
 class AnimationModifier:
     '''
     Animation modification container class
     '''
+    __slots__ = ('name', 'value')
+
     # Modifier validation tree
     valid_modifiers = {
         'loops': int,
@@ -221,7 +234,7 @@ class AnimationModifier:
 
         In most cases we can just the string representation of the object
         '''
-        return "{0}".format(self)
+        return str(self)
 
 
 class AnimationModifierList:
@@ -237,12 +250,15 @@ class AnimationModifierList:
     def __init__(self):
         self.modifiers = []
 
+        # Cached strModifiers output
+        self._modifiers_str = None
+
     def setModifiers(self, modifier_list):
         '''
         Apply modifiers to Animation
         '''
-        for modifier in modifier_list:
-            self.modifiers.append(AnimationModifier(modifier[0], modifier[1]))
+        self.modifiers.extend(AnimationModifier(name, value) for name, value in modifier_list)
+        self._modifiers_str = None
 
     def clean(self, new_modifier, new, old):
         '''
@@ -260,6 +276,8 @@ class AnimationModifierList:
 
         If it doesn't exist already, just add it.
         '''
+        self._modifiers_str = None
+
         # If new_modifier is loops and loop exists, remove loop
         if not self.clean(new_modifier, 'loops', 'loop'):
             return
@@ -292,13 +310,9 @@ class AnimationModifierList:
         '''
         __repr__ of Position when multiple inheritance is used
         '''
-        output = ""
-        for index, modifier in enumerate(sorted(self.modifiers, key=lambda x: x.name)):
-            if index > 0:
-                output += ","
-            output += "{0}".format(modifier)
-
-        return output
+        if self._modifiers_str is None:
+            self._modifiers_str = ",".join(str(modifier) for modifier in sorted(self.modifiers, key=lambda x: x.name))
+        return self._modifiers_str
 
     def __repr__(self):
         return self.strModifiers()
@@ -328,13 +342,14 @@ class AnimationModifierList:
 
         In most cases we can just the string representation of the object
         '''
-        return "{0}".format(self)
+        return str(self)
 
 
 class PixelModifier:
     '''
     Pixel modification container class
     '''
+    __slots__ = ('operator', 'value')
 
     def __init__(self, operator, value):
         self.operator = operator
@@ -349,16 +364,7 @@ class PixelModifier:
         '''
         Returns operator type
         '''
-        types = {
-            None: 'Set',
-            '+': 'Add',
-            '-': 'Subtract',
-            '+:': 'NoRoll_Add',
-            '-:': 'NoRoll_Subtract',
-            '<<': 'LeftShift',
-            '>>': 'RightShift',
-        }
-        return types[self.operator]
+        return pixel_operator_types[self.operator]
 
     def kllify(self):
         '''
@@ -366,38 +372,37 @@ class PixelModifier:
 
         In most cases we can just the string representation of the object
         '''
-        return "{0}".format(self)
+        return str(self)
 
 
 class PixelModifierList:
     '''
     Pixel modification container list class
 
-    Contains a list of modifiers
+    Contains a tuple of modifiers
     Index 0, corresponds to pixel 0
     '''
 
     def __init__(self):
-        self.modifiers = []
+        self.modifiers = ()
+
+        # Cached strModifiers output
+        self._modifiers_str = None
 
     def setModifiers(self, modifier_list):
         '''
         Apply modifier to each pixel channel
         '''
-        for modifier in modifier_list:
-            self.modifiers.append(PixelModifier(modifier[0], modifier[1]))
+        self.modifiers += tuple(PixelModifier(operator, value) for operator, value in modifier_list)
+        self._modifiers_str = None
 
     def strModifiers(self):
         '''
         __repr__ of Position when multiple inheritance is used
         '''
-        output = ""
-        for index, modifier in enumerate(self.modifiers):
-            if index > 0:
-                output += ","
-            output += "{0}".format(modifier)
-
-        return output
+        if self._modifiers_str is None:
+            self._modifiers_str = ",".join(str(modifier) for modifier in self.modifiers)
+        return self._modifiers_str
 
     def __repr__(self):
         return self.strModifiers()
@@ -408,4 +413,4 @@ class PixelModifierList:
 
         In most cases we can just the string representation of the object
         '''
-        return "{0}".format(self)
+        return str(self)
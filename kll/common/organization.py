@@ -20,7 +20,6 @@ KLL Data Organization
 
 ### Imports ###
 
-import copy
 import re
 
 import kll.common.expression as expression
@@ -36,13 +35,24 @@ WARNING = '\033[5;1;33mWARNING\033[0m:'
 
 ansi_escape = re.compile(r'\x1b[^m]*m')
 
+# Id types that are USB HID output codes
+usb_code_types = frozenset(['USBCode', 'SysCode', 'ConsCode'])
+
+# Non-USB Id types kept as triggers during USB code reduction
+non_usb_trigger_types = frozenset(['IndCode', 'GenericTrigger', 'Layer', 'LayerLock', 'LayerShift', 'LayerLatch', 'ScanCode'])
+
 
 ### Classes ###
 
 class Data:
     '''
     Base class for KLL datastructures
+
+    Adding and merging is bound by dict, list and attribute access rather than arithmetic or memory,
+    so subclasses declare empty __slots__
     '''
+    __slots__ = ('data', 'parent', 'connect_id', 'merge_in_log')
+
     # Debug output formatters
     debug_output = {
         'add': "\t\033[1;42;37m++\033[0m\033[1mADD KEY\033[1;42;37m++\033[0m \033[1m<==\033[0m {0}",
@@ -53,6 +63,16 @@ class Data:
         'dup': "\t\033[1;46;37m!!\033[0m\033[1mDUP KEY\033[1;46;37m!!\033[0m \033[1m<==\033[0m {0}",
     }
 
+    # Element debug output formatters, keyed by single (bold key)
+    elem_output = {
+        True: "\033[1;33m{0: <20}\033[0m \033[1;36;41m>\033[0m {1}\n",
+        False: "{0: <20} \033[1;36;41m>\033[0m {1}\n",
+    }
+
+    # Formatters with the ANSI colors stripped, used when color output is disabled
+    debug_output_plain = {tag: ansi_escape.sub('', output) for tag, output in debug_output.items()}
+    elem_output_plain = {single: ansi_escape.sub('', output) for single, output in elem_output.items()}
+
     def __init__(self, parent):
         '''
         Initialize datastructure
@@ -110,7 +130,7 @@ class Data:
                 key,
                 expression,
             )
-            print(debug[1] and output or ansi_escape.sub('', output))
+            print(output if debug[1] else ansi_escape.sub('', output))
 
         # Add to log, and enable key
         self.merge_in_log.append([key, expression, True])
@@ -124,18 +144,22 @@ class Data:
         @param expression: KLL Expression (fully tokenized and parsed)
         @param debug:      Enable debug output
         '''
+        # Debug settings do not change while adding/merging
+        show_debug = debug[0]
+        templates = self.debug_templates(debug[1])
+
         # Lookup unique keys for expression
         keys = expression.unique_keys()
 
         # Add/Modify expressions in datastructure
         for key, uniq_expr in keys:
             # Check which operation we are trying to do, add or modify
-            if debug[0]:
-                if key in self.data.keys():
-                    output = self.debug_output['mod'].format(key)
+            if show_debug:
+                if key in self.data:
+                    output = templates['mod'].format(key)
                 else:
-                    output = self.debug_output['add'].format(key)
-                print(debug[1] and output or ansi_escape.sub('', output))
+                    output = templates['add'].format(key)
+                print(output)
 
             self.data[key] = uniq_expr
 
@@ -159,8 +183,8 @@ class Data:
 
             # Display key:expression being merged in
             if debug[0]:
-                output = merge_in.elem_str(key, True)
-                print(debug[1] and output or ansi_escape.sub('', output), end="")
+                output = merge_in.elem_str(key, True, debug[1])
+                print(output, end="")
 
             self.add_expression(kll_expression, debug)
 
@@ -189,17 +213,24 @@ class Data:
         '''
         self.connect_id = connect_id
 
-    def elem_str(self, key, single=False):
+    def debug_templates(self, color):
+        '''
+        Debug output formatters
+
+        @param color: Use ANSI colors
+        '''
+        return self.debug_output if color else self.debug_output_plain
+
+    def elem_str(self, key, single=False, color=True):
         '''
         Debug output for a single element
 
         @param key:    Index to datastructure
         @param single: Setting to True will bold the key
+        @param color:  Use ANSI colors
         '''
-        if single:
-            return "\033[1;33m{0: <20}\033[0m \033[1;36;41m>\033[0m {1}\n".format(key, self.data[key])
-        else:
-            return "{0: <20} \033[1;36;41m>\033[0m {1}\n".format(key, self.data[key])
+        templates = self.elem_output if color else self.elem_output_plain
+        return templates[single].format(key, self.data[key])
 
     def __repr__(self):
         output = ""
@@ -219,6 +250,8 @@ class MappingData(Data):
     USBCode   trigger -> result
     Animation trigger -> result
     '''
+    __slots__ = ()
+
     def add_expression(self, expression, debug):
         '''
         Add expression to data structure
@@ -247,6 +280,10 @@ class MappingData(Data):
         @param expression: KLL Expression (fully tokenized and parsed)
         @param debug:      Enable debug output
         '''
+        # Debug settings do not change while adding/merging
+        show_debug = debug[0]
+        templates = self.debug_templates(debug[1])
+
         # Lookup unique keys for expression
         keys = expression.unique_keys()
 
@@ -260,20 +297,22 @@ class MappingData(Data):
             # This means we can't simplify yet
             # In addition, :+ and :- are stackable, which means each key has a list of expressions
             # We append the operator to differentiate between the different types of delayed operations
-            key = "{0}{1}".format(operator, ukey)
+            key = operator + ukey
 
-            # Determine if key exists already
-            exists = key in self.data.keys()
+            # Lookup current expressions for key (None if it doesn't exist yet)
+            existing = self.data.get(key)
 
             # Add/Modify
             if operator in [':', '::', 'i:', 'i::']:
-                debug_tag = exists and 'mod' or 'add'
+                debug_tag = existing is not None and 'mod' or 'add'
 
             # Append/Remove
             else:
                 # Check to make sure we haven't already appended expression
                 # Use the string representation to do the comparison (general purpose)
-                if exists and "{0}".format(uniq_expr) in ["{0}".format(elem) for elem in self.data[key]]:
+                # Expression strings are cached, so stop at the first match rather than formatting the whole list
+                uniq_str = str(uniq_expr)
+                if existing is not None and any(uniq_str == str(elem) for elem in existing):
                     debug_tag = 'dup'
 
                 # Append
@@ -285,22 +324,17 @@ class MappingData(Data):
                     debug_tag = 'rem'
 
             # Debug output
-            if debug[0]:
-                output = self.debug_output[debug_tag].format(key)
-                print(debug[1] and output or ansi_escape.sub('', output))
+            if show_debug:
+                output = templates[debug_tag].format(key)
+                print(output)
 
             # Don't append if a duplicate
             if debug_tag == 'dup':
                 continue
 
-            # Append, rather than replace
+            # Append, rather than replace (creating the initial list if necessary)
             if operator in [':+', ':-', 'i:+', 'i:-']:
-                if exists:
-                    self.data[key].append(uniq_expr)
-
-                # Create initial list
-                else:
-                    self.data[key] = [uniq_expr]
+                self.data.setdefault(key, []).append(uniq_expr)
             else:
                 self.data[key] = [uniq_expr]
 
@@ -348,7 +382,7 @@ class MappingData(Data):
             max_uid = value[0].max_trigger_uid()
 
             # Initial value
-            if connect_id not in max_dict.keys():
+            if connect_id not in max_dict:
                 max_dict[connect_id] = 0
 
             # Update if necessary
@@ -373,7 +407,7 @@ class MappingData(Data):
         lazy_keys = {}
         for key, expr, enabled in reversed(self.merge_in_log):
             if key[0:2] == '::' or key[0:3] == 'i::':
-                if key not in lazy_keys.keys():
+                if key not in lazy_keys:
                     # Debug info
                     if debug:
                         print("\033[1mLazy\033[0m", key, expr)
@@ -383,7 +417,7 @@ class MappingData(Data):
                     lazy_keys[target_key] = expr
 
                     # Check if we need to do a lazy replacement
-                    if target_key in result_code_lookup.keys():
+                    if target_key in result_code_lookup:
                         expr_keys = result_code_lookup[target_key]
                         for target_expr_key in expr_keys:
                             # Calculate new key
@@ -405,15 +439,16 @@ class MappingData(Data):
                                 ))
 
                             # Do replacement
-                            self.data[new_key] = [expression.MapExpression(
+                            new_map = expression.MapExpression(
                                     orig_expr.triggers,
                                     orig_expr.operator,
                                     expr.results
-                            )]
-                            self.data[new_key][0].connect_id = orig_expr.connect_id
+                            )
+                            new_map.connect_id = orig_expr.connect_id
 
                             # Unset basemap on expression
-                            self.data[new_key][0].base_map = False
+                            new_map.base_map = False
+                            self.data[new_key] = [new_map]
 
     def merge(self, merge_in, map_type, debug):
         '''
@@ -438,93 +473,104 @@ class MappingData(Data):
         @param map_type: Used fo map specific merges
         @param debug:    Enable debug out
         '''
+        # Debug settings do not change while adding/merging
+        show_debug = debug[0]
+        templates = self.debug_templates(debug[1])
+
         # Get unique list of ordered keys
         # We can't just query the keys directly from the as we need them in order of being added
         # In addition, we need a unique list of keys, where the most recently added is the most important
         cur_keys = []
+        seen_keys = set()
         for key, expr, enabled in reversed(merge_in.merge_in_log):
-            if key not in cur_keys:
-                cur_keys.insert(0, key)
-
-        # Lazy Set ::
-        lazy_keys = [key for key in cur_keys if key[0:2] == '::' or key[0:3] == 'i::']
-        cur_keys = list(set(cur_keys) - set(lazy_keys))
-
-        # Append :+
-        append_keys = [key for key in cur_keys if key[0:2] == ':+' or key[0:3] == 'i:+']
-        cur_keys = list(set(cur_keys) - set(append_keys))
-
-        # Remove :-
-        remove_keys = [key for key in cur_keys if key[0:2] == ':-' or key[0:3] == 'i:-']
-        cur_keys = list(set(cur_keys) - set(remove_keys))
-
-        # Set :
-        # Everything left is just a set
-        set_keys = cur_keys
-
-        # First process the :: (or lazy) operators
-        # We need to read into this datastructure and apply those first
-        # Otherwise we may get undesired behaviour
-        for key in lazy_keys:
-            # Display key:expression being merged in
-            if debug[0]:
-                output = merge_in.elem_str(key, True)
-                print(debug[1] and output or ansi_escape.sub('', output), end="")
-
-            # Construct target key
-            # XXX (HaaTa) We now delay lazy operation application till reduction
-            #target_key = key[0] == 'i' and "i{0}".format(key[2:]) or key[1:]
-            target_key = key
+            if key not in seen_keys:
+                seen_keys.add(key)
+                cur_keys.append(key)
+        cur_keys.reverse()
+
+        # Partition keys by operator, keeping the merge order
+        # Lazy Set ::, Append :+, Remove :-
+        # Everything else is just a Set :
+        # Lazy, append and set keys carry their expressions along, (key, expressions)
+        # Remove keys only look up expressions if the target key exists
+        lazy_keys = []
+        append_keys = []
+        remove_keys = []
+        set_keys = []
+        for key in cur_keys:
+            operator = key[1:3] if key[0] == 'i' else key[0:2]
+            if operator == '::':
+                lazy_keys.append((key, merge_in.data[key]))
+            elif operator == ':+':
+                append_keys.append((key, merge_in.data[key]))
+            elif operator == ':-':
+                remove_keys.append(key)
+            else:
+                set_keys.append((key, merge_in.data[key]))
 
-            # Lazy expressions will be dropped later at reduction
-            debug_tag = 'mod'
+        # Without debug output the lazy (::) and assignment (:) operators are plain replacements
+        # Apply them as bulk dictionary updates
+        if not show_debug:
+            self.data.update(lazy_keys)
+            self.data.update(set_keys)
 
-            # Debug output
-            if debug[0]:
-                output = self.debug_output[debug_tag].format(key)
-                print(debug[1] and output or ansi_escape.sub('', output))
+        else:
+            # First process the :: (or lazy) operators
+            # We need to read into this datastructure and apply those first
+            # Otherwise we may get undesired behaviour
+            for key, value in lazy_keys:
+                # Display key:expression being merged in
+                output = merge_in.elem_str(key, True, debug[1])
+                print(output, end="")
+
+                # Construct target key
+                # XXX (HaaTa) We now delay lazy operation application till reduction
+                #target_key = key[0] == 'i' and "i{0}".format(key[2:]) or key[1:]
+                target_key = key
+
+                # Lazy expressions will be dropped later at reduction
+                debug_tag = 'mod'
 
-            # Only replace
-            self.data[target_key] = merge_in.data[key]
+                # Debug output
+                output = templates[debug_tag].format(key)
+                print(output)
 
-            # Unset BaseMapContext tag if not a BaseMapContext
-            if map_type != 'BaseMapContext':
-                self.data[target_key][0].base_map = False
+                # Only replace
+                self.data[target_key] = value
 
-        # Then apply : assignment operators
-        for key in set_keys:
-            # Display key:expression being merged in
-            if debug[0]:
-                output = merge_in.elem_str(key, True)
-                print(debug[1] and output or ansi_escape.sub('', output), end="")
+            # Then apply : assignment operators
+            for key, value in set_keys:
+                # Display key:expression being merged in
+                output = merge_in.elem_str(key, True, debug[1])
+                print(output, end="")
 
-            # Construct target key
-            target_key = key
+                # Construct target key
+                target_key = key
 
-            # Indicate if add or modify
-            if target_key in self.data.keys():
-                debug_tag = 'mod'
-            else:
-                debug_tag = 'add'
+                # Indicate if add or modify
+                if target_key in self.data:
+                    debug_tag = 'mod'
+                else:
+                    debug_tag = 'add'
 
-            # Debug output
-            if debug[0]:
-                output = self.debug_output[debug_tag].format(key)
-                print(debug[1] and output or ansi_escape.sub('', output))
+                # Debug output
+                output = templates[debug_tag].format(key)
+                print(output)
 
-            # Set into new datastructure regardless
-            self.data[target_key] = merge_in.data[key]
+                # Set into new datastructure regardless
+                self.data[target_key] = value
 
-            # Unset BaseMap flag if this is not a BaseMap merge
-            if map_type != 'BaseMapContext':
-                self.data[target_key][0].base_map = False
+        # Unset BaseMap flag on lazy and assigned expressions if this is not a BaseMap merge
+        if map_type != 'BaseMapContext':
+            for key, value in lazy_keys + set_keys:
+                value[0].base_map = False
 
         # Now apply append operations
-        for key in append_keys:
+        for key, value in append_keys:
             # Display key:expression being merged in
-            if debug[0]:
-                output = merge_in.elem_str(key, True)
-                print(debug[1] and output or ansi_escape.sub('', output), end="")
+            if show_debug:
+                output = merge_in.elem_str(key, True, debug[1])
+                print(output, end="")
 
             # Construct target key
             # XXX (HaaTa) Might not be correct, but seems to work with the merge_in_log
@@ -535,23 +581,20 @@ class MappingData(Data):
             debug_tag = 'app'
 
             # Debug output
-            if debug[0]:
-                output = self.debug_output[debug_tag].format(key)
-                print(debug[1] and output or ansi_escape.sub('', output))
+            if show_debug:
+                output = templates[debug_tag].format(key)
+                print(output)
 
-            # Extend list if it exists
-            if target_key in self.data.keys():
-                self.data[target_key].extend(merge_in.data[key])
-            else:
-                self.data[target_key] = merge_in.data[key]
+            # Extend list, creating it if it doesn't exist
+            self.data.setdefault(target_key, []).extend(value)
 
         # Finally apply removal operations to this datastructure
         # If the target removal doesn't exist, ignore silently (show debug message)
         for key in remove_keys:
             # Display key:expression being merged in
-            if debug[0]:
-                output = merge_in.elem_str(key, True)
-                print(debug[1] and output or ansi_escape.sub('', output), end="")
+            if show_debug:
+                output = merge_in.elem_str(key, True, debug[1])
+                print(output, end="")
 
             # Construct target key
             # XXX (HaaTa) Might not be correct, but seems to work with the merge_in_log
@@ -559,35 +602,34 @@ class MappingData(Data):
             target_key = key
 
             # Drop right away if target datastructure doesn't have target key
-            if target_key not in self.data.keys():
+            if target_key not in self.data:
                 debug_tag = 'drp'
 
                 # Debug output
-                if debug[0]:
-                    output = self.debug_output[debug_tag].format(key)
-                    print(debug[1] and output or ansi_escape.sub('', output))
+                if show_debug:
+                    output = templates[debug_tag].format(key)
+                    print(output)
 
                 continue
 
             # Compare expressions to be removed with the current set
             # Use strings to compare
-            remove_expressions = ["{0}".format(expr) for expr in merge_in.data[key]]
-            current_expressions = [("{0}".format(expr), expr) for expr in self.data[target_key]]
-            for string, expr in current_expressions:
-                debug_tag = 'drp'
-
-                # Check if an expression matches
-                if string in remove_expressions:
-                    debug_tag = 'rem'
-
-                # Debug output
-                if debug[0]:
-                    output = self.debug_output[debug_tag].format(key)
-                    print(debug[1] and output or ansi_escape.sub('', output))
-
-                # Remove if found
-                if debug_tag == 'rem':
-                    self.data[target_key] = [value for value in self.data.values() if value != expr]
+            remove_expressions = set(str(expr) for expr in merge_in.data[key])
+            current_expressions = self.data[target_key]
+            remaining = [expr for expr in current_expressions if str(expr) not in remove_expressions]
+
+            # Debug output, rem for each matching expression, drp otherwise
+            if show_debug:
+                for expr in current_expressions:
+                    debug_tag = str(expr) in remove_expressions and 'rem' or 'drp'
+                    output = templates[debug_tag].format(key)
+                    print(output)
+
+            # Keep the unmatched expressions, drop the key if none are left
+            if remaining:
+                self.data[target_key] = remaining
+            else:
+                del self.data[target_key]
 
         # Now append the merge_in_log
         self.merge_in_log.extend(merge_in.merge_in_log)
@@ -597,17 +639,23 @@ class MappingData(Data):
         Post-processing step for merges that may need to remove some data in the organization.
         Mainly used for dropping BaseMapContext expressions after generating a PartialMapContext.
         '''
+        # Debug settings do not change during cleanup, strip colors from the formatters once
+        show_debug = debug[0]
+        drop_output = "\t\033[1;34mDROP\033[0m {0}"
+        keep_output = "\t\033[1;32mKEEP\033[0m {0}"
+        if not debug[1]:
+            drop_output = ansi_escape.sub('', drop_output)
+            keep_output = ansi_escape.sub('', keep_output)
+
         # Using this dictionary, replace all the trigger USB codes
-        # Iterate over a copy so we can modify the dictionary in place
-        for key, expr in self.data.copy().items():
+        # Iterate over a snapshot of the items so we can modify the dictionary in place
+        for key, expr in list(self.data.items()):
             if expr[0].base_map:
-                if debug[0]:
-                    output = "\t\033[1;34mDROP\033[0m {0}".format(self.data[key][0])
-                    print(debug[1] and output or ansi_escape.sub('', output))
+                if show_debug:
+                    print(drop_output.format(expr[0]))
                 del self.data[key]
-            elif debug[0]:
-                output = "\t\033[1;32mKEEP\033[0m {0}".format(self.data[key][0])
-                print(debug[1] and output or ansi_escape.sub('', output))
+            elif show_debug:
+                print(keep_output.format(expr[0]))
 
     def reduction(self, debug=False):
         '''
@@ -619,16 +667,21 @@ class MappingData(Data):
         '''
         result_code_lookup = {}
 
+        # Merge keys of the single ScanCode expressions, calculated on first use
+        result_key_lookup = {}
+
         # Prune merge_in_log
         merge_in_pruned = self.merge_in_log_prune(debug)
 
         # Build dictionary of single ScanCodes first
-        for key, expr in self.data.items():
-            if expr[0].elems()[0] == 1 and expr[0].triggers[0][0][0].type == 'ScanCode':
-                result_code_lookup[expr[0].result_str()] = expr
+        # elems() is cached per expression, so this is a single pass over the current data
+        for expr in self.data.values():
+            head = expr[0]
+            if head.elems()[0] == 1 and head.triggers[0][0][0].type == 'ScanCode':
+                result_code_lookup[head.result_str()] = expr
 
         # Skip if dict is empty
-        if len(self.data.keys()) == 0:
+        if len(self.data) == 0:
             return
 
         # Instead of using the .data dictionary, use the merge_in_log which maintains the expression application order
@@ -639,26 +692,29 @@ class MappingData(Data):
                 continue
 
             # Lookup currently merged expression
-            if key not in self.data.keys():
+            if key not in self.data:
                 continue
             expr = self.data[key]
 
             for sub_expr in expr:
                 # 1) Single USB Codes trigger results will replace the original ScanCode result
-                if sub_expr.elems()[0] == 1 and sub_expr.triggers[0][0][0].type in ['USBCode', 'SysCode', 'ConsCode']:
+                if sub_expr.elems()[0] == 1 and sub_expr.triggers[0][0][0].type in usb_code_types:
                     # Debug info
                     if debug:
                         print("\033[1mSingle\033[0m", key, expr)
 
                     # Lookup trigger to see if it exists
                     trigger_str = sub_expr.trigger_str()
-                    if trigger_str in result_code_lookup.keys():
+                    if trigger_str in result_code_lookup:
                         # Calculate new key
                         new_expr = result_code_lookup[trigger_str][0]
-                        new_key = "{0}{1}".format(
-                            new_expr.operator,
-                            new_expr.unique_keys()[0][0]
-                        )
+                        new_key = result_key_lookup.get(trigger_str)
+                        if new_key is None:
+                            new_key = "{0}{1}".format(
+                                new_expr.operator,
+                                new_expr.unique_keys()[0][0]
+                            )
+                            result_key_lookup[trigger_str] = new_key
 
                         # Determine action based on the new_expr.operator
                         orig_expr = self.data[new_key][0]
@@ -674,17 +730,18 @@ class MappingData(Data):
                                 ))
 
                             # Do replacement
-                            self.data[new_key] = [expression.MapExpression(
+                            new_map = expression.MapExpression(
                                     orig_expr.triggers,
                                     orig_expr.operator,
                                     sub_expr.results
-                            )]
+                            )
 
                             # Transfer connect_id
-                            self.data[new_key][0].connect_id = orig_expr.connect_id
+                            new_map.connect_id = orig_expr.connect_id
 
                             # Unset basemap on expression
-                            self.data[new_key][0].base_map = False
+                            new_map.base_map = False
+                            self.data[new_key] = [new_map]
 
                         # Add expression
                         elif sub_expr.operator in [':+']:
@@ -697,15 +754,16 @@ class MappingData(Data):
                                 ))
 
                             # Add expression
-                            self.data[new_key].append(expression.MapExpression(
+                            new_exprs = self.data[new_key]
+                            new_exprs.append(expression.MapExpression(
                                 orig_expr.triggers,
                                 orig_expr.operator,
                                 sub_expr.results
                             ))
 
                             # Unset basemap on sub results
-                            for sub_expr in self.data[new_key]:
-                                sub_expr.base_map = False
+                            for new_sub_expr in new_exprs:
+                                new_sub_expr.base_map = False
 
                         # Remove expression
                         elif sub_expr.operator in [':-']:
@@ -718,14 +776,14 @@ class MappingData(Data):
                                 ))
 
                         # Remove old key
-                        if key in self.data.keys():
+                        if key in self.data:
                             del self.data[key]
 
                     # Otherwise drop HID expression
                     else:
                         if debug:
                             print("\t\033[1;34mDROP\033[0m")
-                        if key in self.data.keys():
+                        if key in self.data:
                             del self.data[key]
 
                 # 2) Complex triggers are processed to replace out any USB Codes with Scan Codes
@@ -739,19 +797,17 @@ class MappingData(Data):
                     # Dive through sequence->combo->identifier (sequence of combos of ids)
                     replace = False
                     drop = False
-                    for seq_in, sequence in enumerate(sub_expr.triggers):
-                        for com_in, combo in enumerate(sequence):
+                    for sequence in sub_expr.triggers:
+                        for combo in sequence:
                             for ident_in, identifier in enumerate(combo):
-                                ident_str = "({0})".format(identifier)
-
-                                # Replace identifier
-                                if ident_str in result_code_lookup.keys():
-                                    match_expr = result_code_lookup[ident_str]
-                                    sub_expr.triggers[seq_in][com_in][ident_in] = match_expr[0].triggers[0][0][0]
+                                # Replace identifier (combo is the same list as in sub_expr.triggers)
+                                match_expr = result_code_lookup.get("({0})".format(identifier))
+                                if match_expr is not None:
+                                    combo[ident_in] = match_expr[0].triggers[0][0][0]
                                     replace = True
 
                                 # Ignore non-USB triggers
-                                elif identifier.type in ['IndCode', 'GenericTrigger', 'Layer', 'LayerLock', 'LayerShift', 'LayerLatch', 'ScanCode']:
+                                elif identifier.type in non_usb_trigger_types:
                                     pass
 
                                 # Drop everything else
@@ -760,6 +816,7 @@ class MappingData(Data):
 
                     # Trigger Identifier was replaced
                     if replace:
+                        sub_expr.clear_cache()
                         if debug:
                             print("\t\033[1;32mREPLACE\033[0m", expr)
 
@@ -783,6 +840,7 @@ class AnimationData(Data):
 
     Animation -> modifiers
     '''
+    __slots__ = ()
 
 
 class AnimationFrameData(Data):
@@ -791,6 +849,7 @@ class AnimationFrameData(Data):
 
     Animation -> Pixel Settings
     '''
+    __slots__ = ()
 
 
 class CapabilityData(Data):
@@ -799,6 +858,7 @@ class CapabilityData(Data):
 
     Capability -> C Function/Identifier
     '''
+    __slots__ = ()
 
 
 class DefineData(Data):
@@ -807,6 +867,7 @@ class DefineData(Data):
 
     Variable -> C Define/Identifier
     '''
+    __slots__ = ()
 
 
 class PixelChannelData(Data):
@@ -815,6 +876,7 @@ class PixelChannelData(Data):
 
     Pixel -> Channels
     '''
+    __slots__ = ()
 
     def maxpixelid(self):
         '''
@@ -833,7 +895,7 @@ class PixelChannelData(Data):
                 max_uid = value.pixel.uid
 
             # Initial value
-            if connect_id not in max_pixel.keys():
+            if connect_id not in max_pixel:
                 max_pixel[connect_id] = 0
 
             # Update if necessary
@@ -851,6 +913,7 @@ class PixelPositionData(Data):
 
     Pixel -> Physical Location
     '''
+    __slots__ = ()
 
     def add_expression(self, expression, debug):
         '''
@@ -861,21 +924,25 @@ class PixelPositionData(Data):
         @param expression: KLL Expression (fully tokenized and parsed)
         @param debug:      Enable debug output
         '''
+        # Debug settings do not change while adding/merging
+        show_debug = debug[0]
+        templates = self.debug_templates(debug[1])
+
         # Lookup unique keys for expression
         keys = expression.unique_keys()
 
         # Add/Modify expressions in datastructure
         for key, uniq_expr in keys:
             # Check which operation we are trying to do, add or modify
-            if debug[0]:
-                if key in self.data.keys():
-                    output = self.debug_output['mod'].format(key)
+            if show_debug:
+                if key in self.data:
+                    output = templates['mod'].format(key)
                 else:
-                    output = self.debug_output['add'].format(key)
-                print(debug[1] and output or ansi_escape.sub('', output))
+                    output = templates['add'].format(key)
+                print(output)
 
             # If key already exists, just update
-            if key in self.data.keys():
+            if key in self.data:
                 self.data[key].update(uniq_expr)
             else:
                 self.data[key] = uniq_expr
@@ -890,6 +957,7 @@ class ScanCodePositionData(Data):
 
     ScanCode -> Physical Location
     '''
+    __slots__ = ()
 
     def add_expression(self, expression, debug):
         '''
@@ -900,21 +968,25 @@ class ScanCodePositionData(Data):
         @param expression: KLL Expression (fully tokenized and parsed)
         @param debug:      Enable debug output
         '''
+        # Debug settings do not change while adding/merging
+        show_debug = debug[0]
+        templates = self.debug_templates(debug[1])
+
         # Lookup unique keys for expression
         keys = expression.unique_keys()
 
         # Add/Modify expressions in datastructure
         for key, uniq_expr in keys:
             # Check which operation we are trying to do, add or modify
-            if debug[0]:
-                if key in self.data.keys():
-                    output = self.debug_output['mod'].format(key)
+            if show_debug:
+                if key in self.data:
+                    output = templates['mod'].format(key)
                 else:
-                    output = self.debug_output['add'].format(key)
-                print(debug[1] and output or ansi_escape.sub('', output))
+                    output = templates['add'].format(key)
+                print(output)
 
             # If key already exists, just update
-            if key in self.data.keys():
+            if key in self.data:
                 self.data[key].update(uniq_expr)
             else:
                 self.data[key] = uniq_expr
@@ -930,6 +1002,7 @@ class VariableData(Data):
     Variable -> Data
     Array    -> Data
     '''
+    __slots__ = ()
 
     def add_expression(self, expression, debug):
         '''
@@ -942,23 +1015,27 @@ class VariableData(Data):
         @param expression: KLL Expression (fully tokenized and parsed)
         @param debug:      Enable debug output
         '''
+        # Debug settings do not change while adding/merging
+        show_debug = debug[0]
+        templates = self.debug_templates(debug[1])
+
         # Lookup unique keys for expression
         keys = expression.unique_keys()
 
         # Add/Modify expressions in datastructure
         for key, uniq_expr in keys:
             # Check which operation we are trying to do, add or modify
-            if debug[0]:
-                if key in self.data.keys():
-                    output = self.debug_output['mod'].format(key)
+            if show_debug:
+                if key in self.data:
+                    output = templates['mod'].format(key)
                 else:
-                    output = self.debug_output['add'].format(key)
-                print(debug[1] and output or ansi_escape.sub('', output))
+                    output = templates['add'].format(key)
+                print(output)
 
             # Check to see if we need to cap-off the array (a position parameter is given)
             if uniq_expr.type == 'Array' and uniq_expr.pos is not None:
                 # Modify existing array
-                if key in self.data.keys():
+                if key in self.data:
                     self.data[key].merge_array(uniq_expr)
 
                 # Add new array
@@ -999,6 +1076,19 @@ class Organization:
         self.scan_code_position_data = ScanCodePositionData(self)
         self.variable_data = VariableData(self)
 
+        # Sub-datastructures in merge order, the stores are never replaced after initialization
+        self._stores = (
+            self.animation_data,
+            self.animation_frame_data,
+            self.capability_data,
+            self.define_data,
+            self.mapping_data,
+            self.pixel_channel_data,
+            self.pixel_position_data,
+            self.scan_code_position_data,
+            self.variable_data,
+        )
+
         # Expression to Datastructure mapping
         self.data_mapping = {
             'AssignmentExpression': {
@@ -1021,6 +1111,14 @@ class Organization:
             },
         }
 
+        # Flattened (expression type, expression subtype) to datastructure lookup
+        # Used when adding expressions, data_mapping is kept for queries
+        self.data_stores = {
+            (expression_type, expression_subtype): data
+            for expression_type, subtypes in self.data_mapping.items()
+            for expression_subtype, data in subtypes.items()
+        }
+
     def __copy__(self):
         '''
         On organization copy, return a safe object
@@ -1029,45 +1127,19 @@ class Organization:
         '''
         new_obj = Organization(self.parent)
 
-        # Copy only .data from each organization
-        new_obj.animation_data.data = copy.copy(self.animation_data.data)
-        new_obj.animation_frame_data.data = copy.copy(self.animation_frame_data.data)
-        new_obj.capability_data.data = copy.copy(self.capability_data.data)
-        new_obj.define_data.data = copy.copy(self.define_data.data)
-        new_obj.mapping_data.data = copy.copy(self.mapping_data.data)
-        new_obj.pixel_channel_data.data = copy.copy(self.pixel_channel_data.data)
-        new_obj.pixel_position_data.data = copy.copy(self.pixel_position_data.data)
-        new_obj.scan_code_position_data.data = copy.copy(self.scan_code_position_data.data)
-        new_obj.variable_data.data = copy.copy(self.variable_data.data)
-
-        # Also copy merge_in_log
-        new_obj.animation_data.merge_in_log = copy.copy(self.animation_data.merge_in_log)
-        new_obj.animation_frame_data.merge_in_log = copy.copy(self.animation_frame_data.merge_in_log)
-        new_obj.capability_data.merge_in_log = copy.copy(self.capability_data.merge_in_log)
-        new_obj.define_data.merge_in_log = copy.copy(self.define_data.merge_in_log)
-        new_obj.mapping_data.merge_in_log = copy.copy(self.mapping_data.merge_in_log)
-        new_obj.pixel_channel_data.merge_in_log = copy.copy(self.pixel_channel_data.merge_in_log)
-        new_obj.pixel_position_data.merge_in_log = copy.copy(self.pixel_position_data.merge_in_log)
-        new_obj.scan_code_position_data.merge_in_log = copy.copy(self.scan_code_position_data.merge_in_log)
-        new_obj.variable_data.merge_in_log = copy.copy(self.variable_data.merge_in_log)
+        # Copy only .data and merge_in_log from each sub-datastructure
+        # Stores are in the same order for every organization
+        for new_store, store in zip(new_obj.stores(), self.stores()):
+            new_store.data = store.data.copy()
+            new_store.merge_in_log = store.merge_in_log.copy()
 
         return new_obj
 
     def stores(self):
         '''
-        Returns list of sub-datastructures
+        Returns tuple of sub-datastructures
         '''
-        return [
-            self.animation_data,
-            self.animation_frame_data,
-            self.capability_data,
-            self.define_data,
-            self.mapping_data,
-            self.pixel_channel_data,
-            self.pixel_position_data,
-            self.scan_code_position_data,
-            self.variable_data,
-        ]
+        return self._stores
 
     def add_expression(self, expression, debug):
         '''
@@ -1078,19 +1150,13 @@ class Organization:
         @param expression: KLL Expression (fully tokenized and parsed)
         @param debug:      Enable debug output
         '''
-        # Determine type of of Expression
-        expression_type = expression.__class__.__name__
-
-        # Determine Expression Subtype
-        expression_subtype = expression.type
-
-        # Locate datastructure
-        data = self.data_mapping[expression_type][expression_subtype]
+        # Locate datastructure using the type and subtype of the Expression
+        data = self.data_stores[(type(expression).__name__, expression.type)]
 
         # Debug output
         if debug[0]:
             output = "\t\033[4m{0}\033[0m".format(data.__class__.__name__)
-            print(debug[1] and output or ansi_escape.sub('', output))
+            print(output if debug[1] else ansi_escape.sub('', output))
 
         # Add expression to determined datastructure
         data.add_expression(expression, debug)
@@ -1143,4 +1209,4 @@ class Organization:
         return self.pixel_channel_data.maxpixelid()
 
     def __repr__(self):
-        return "{0}".format(self.stores())
+        return "{0}".format(list(self.stores()))
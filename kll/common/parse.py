@@ -27,6 +27,11 @@ REMEMBER: When editing parser BNF-like expressions, order matters. Specifically
 
 ### Imports ###
 
+import itertools
+import re
+
+from collections import OrderedDict
+
 from kll.common.id import (
     AnimationId, AnimationFrameId,
     CapArgId, CapArgValue, CapId,
@@ -41,8 +46,10 @@ from kll.common.id import (
 from kll.common.modifier import AnimationModifierList
 from kll.common.schedule import AnalogScheduleParam, ScheduleParam, Time
 
+import kll.extern.funcparserlib.parser as funcparser
+
 from kll.extern.funcparserlib.lexer import Token
-from kll.extern.funcparserlib.parser import (some, a, many, oneplus, skip, maybe)
+from kll.extern.funcparserlib.parser import (some, a, many, oneplus, skip, maybe, NoParseError, Parser)
 
 
 
@@ -52,6 +59,60 @@ from kll.extern.funcparserlib.parser import (some, a, many, oneplus, skip, maybe
 ERROR = '\033[5;1;31mERROR\033[0m:'
 WARNING = '\033[5;1;33mWARNING\033[0m:'
 
+# Locale tables used to look up HID codes by name
+hid_lookup_tables = {
+    'USBCode': 'from_hid_keyboard',
+    'SysCode': 'from_hid_sysctrl',
+    'ConsCode': 'from_hid_consumer',
+    'IndCode': 'from_hid_led',
+}
+
+# Timing parameter, number followed by a unit (s, ms, us or ns)
+timing_token = re.compile(r'(.+?)(ms|us|ns|s)$')
+
+# Id types that are converted into PixelIds when used as a pixel
+pixel_uid_types = (HIDId, ScanCodeId)
+
+# Tag of already tokenized (tag, code) HID values, per HID type
+hid_token_tags = {
+    'USBCode': 'USB',
+    'SysCode': 'SYS',
+    'ConsCode': 'CONS',
+    'IndCode': 'IND',
+}
+
+# Pixel address operator names, name -> (PixelAddressId field, sign applied to the value)
+# Bare relative operators (c:i, r:i) have no value and address the current row/column
+pixel_address_operators = {
+    'r:': ('row', 1),
+    'c:': ('col', 1),
+    'r:i': ('relRow', 1),
+    'r:i+': ('relRow', 1),
+    'r:i-': ('relRow', -1),
+    'c:i': ('relCol', 1),
+    'c:i+': ('relCol', 1),
+    'c:i-': ('relCol', -1),
+}
+
+# Uppercase name to integer HID code dictionaries, keyed by (layout name, type)
+# A new layout object is loaded for every kll file, keying on the name shares the dictionaries between them
+# and keeps the cache to one entry per layout name and HID type
+hid_lookup_cache = {}
+
+# Composed sequence string USB codes (sequence of combos of ints), keyed by (layout name, spec, string)
+# HIDIds are mutable, so only the codes are cached and new HIDIds are built for every use
+# Every distinct string adds an entry, so the least recently used are evicted past seq_string_cache_size
+seq_string_cache = OrderedDict()
+seq_string_cache_size = 1024
+
+# Literal token parsers, keyed by (token type, string, parser debug flag)
+# Parser combinators are never modified after construction, so grammars built per expression can share them
+# Parsers only log if built while parser debug is enabled, so debug re-parses need their own parsers
+literal_token_parsers = {}
+
+# NoneId carries no per-use state, so every None keyword shares one instance
+none_id = NoneId()
+
 
 
 ### Classes ###
@@ -88,32 +149,30 @@ class Make:
         token_val = token.value
         if token_val[0] == "U" or token_val[0] == "I":
             token_val = token_val[1:]
-        # CONS specifier
-        elif 'CONS' in token_val:
+        # CONS specifier (prefix only, slicing also works for already tokenized tuples)
+        elif token_val[:4] == 'CONS':
             token_val = token_val[4:]
         # SYS specifier
-        elif 'SYS' in token_val:
+        elif token_val[:3] == 'SYS':
             token_val = token_val[3:]
 
         # Determine locale
         locale = token.locale
 
-        # Determine lookup dictionary
-        lookup = None
-        if type == 'USBCode':
-            lookup = locale.dict('from_hid_keyboard', key_caps=True)
-        elif type == 'SysCode':
-            lookup = locale.dict('from_hid_sysctrl', key_caps=True)
-        elif type == 'ConsCode':
-            lookup = locale.dict('from_hid_consumer', key_caps=True)
-        elif type == 'IndCode':
-            lookup = locale.dict('from_hid_led', key_caps=True)
-
         # If using string representation of USB Code, do lookup, case-insensitive
-        if '"' in token_val:
+        if token_val[0] == '"':
+            # Determine lookup dictionary, only built once per layout name and type
+            lookup = hid_lookup_cache.get((locale.name(), type))
+            if lookup is None:
+                lookup = {
+                    name: int(code, 0)
+                    for name, code in locale.dict(hid_lookup_tables[type], key_caps=True).items()
+                }
+                hid_lookup_cache[(locale.name(), type)] = lookup
+
             try:
                 match_name = token_val[1:-1].upper()
-                hid_code = int(lookup[match_name], 0)
+                hid_code = lookup[match_name]
             except LookupError as err:
                 print("{} {} ({}) is an invalid USB HID Code Lookup...".format(
                     ERROR,
@@ -123,15 +182,7 @@ class Make:
                 raise
         else:
             # Already tokenized
-            if (
-                type == 'USBCode' and token_val[0] == 'USB'
-                    or
-                type == 'SysCode' and token_val[0] == 'SYS'
-                    or
-                type == 'ConsCode' and token_val[0] == 'CONS'
-                    or
-                type == 'IndCode' and token_val[0] == 'IND'
-            ):
+            if token_val[0] == hid_token_tags.get(type):
                 hid_code = token_val[1]
             # Convert
             else:
@@ -244,10 +295,7 @@ class Make:
         '''
         Converts a list a numbers into a list of PixelIds
         '''
-        pixels = []
-        for pixel in pixel_list:
-            pixels.append(PixelId(pixel))
-        return pixels
+        return [PixelId(pixel) for pixel in pixel_list]
 
     def pixelLayer(token):
         '''
@@ -264,10 +312,7 @@ class Make:
         '''
         Converts a list a numbers into a list of PixelLayerIds
         '''
-        layers = []
-        for layer in layer_list:
-            layers.append(PixelLayerId(layer))
-        return layers
+        return [PixelLayerId(layer) for layer in layer_list]
 
     def pixelchan(pixel_list, chans):
         '''
@@ -288,7 +333,7 @@ class Make:
         pixelcap_list = []
         for pixel in pixels:
             # Convert HIDIds into PixelIds
-            if isinstance(pixel, HIDId) or isinstance(pixel, ScanCodeId):
+            if isinstance(pixel, pixel_uid_types):
                 pixel = PixelId(pixel)
             pixel.setModifiers(modifiers)
             pixelcap_list.append(pixel)
@@ -317,40 +362,15 @@ class Make:
             elif isinstance(elems[0], PixelId):
                 pixel_address_list.append(elems[0])
 
-        # No value
+        # No value (c:i, r:i)
         elif isinstance(elems, Token):
-            # Row
-            if "r:i" in elems.name:
-                pixel_address_list.append(PixelAddressId(relRow=0))
-            # Column
-            if "c:i" in elems.name:
-                pixel_address_list.append(PixelAddressId(relCol=0))
-
-        # Operator with value
+            field = pixel_address_operators[elems.name][0]
+            pixel_address_list.append(PixelAddressId(**{field: 0}))
+
+        # Operator with value, Positioning (c:, r:) or Relative Positioning (c:i+, r:i-, etc.)
         elif isinstance(elems[0], Token):
-            # Prepare address value
-            value = elems[1]
-
-            # Positioning
-            if elems[0].type == "ColRowOperator":
-                # Row
-                if elems[0].name == "r:":
-                    pixel_address_list.append(PixelAddressId(row=value))
-                # Column
-                if elems[0].name == "c:":
-                    pixel_address_list.append(PixelAddressId(col=value))
-
-            # Relative Positioning
-            elif elems[0].type == "RelCROperator":
-                if '-' in elems[0].name:
-                    value *= -1
-
-                # Row
-                if "r:i" in elems[0].name:
-                    pixel_address_list.append(PixelAddressId(relRow=value))
-                # Column
-                if "c:i" in elems[0].name:
-                    pixel_address_list.append(PixelAddressId(relCol=value))
+            field, sign = pixel_address_operators[elems[0].name]
+            pixel_address_list.append(PixelAddressId(**{field: elems[1] * sign}))
 
         return pixel_address_list
 
@@ -401,7 +421,7 @@ class Make:
         '''
         Replace key-word with NoneId specifier (which indicates a noneOut capability)
         '''
-        return [[[NoneId()]]]
+        return [[[none_id]]]
 
     def seqString(token, spec='lspec'):
         '''
@@ -415,22 +435,33 @@ class Make:
         # Determine locale
         locale = token.locale
 
-        # Compose string using set locale
-        sequence = None
-        if spec == 'lspec':
-            sequence = locale.compose(token.value[1:-1], minimal_clears=True, no_clears=True)
+        # Compose string using set locale, only once per layout name, spec and string
+        cache_key = (locale.name(), spec, token.value)
+        codes = seq_string_cache.get(cache_key)
+        if codes is not None:
+            seq_string_cache.move_to_end(cache_key)
         else:
-            sequence = locale.compose(token.value[1:-1], minimal_clears=True)
+            sequence = None
+            if spec == 'lspec':
+                sequence = locale.compose(token.value[1:-1], minimal_clears=True, no_clears=True)
+            else:
+                sequence = locale.compose(token.value[1:-1], minimal_clears=True)
+
+            # Lookup uid (usb code) from alias name (used in sequence)
+            from_hid_keyboard = locale.json()['from_hid_keyboard']
+            codes = tuple(
+                tuple(int(from_hid_keyboard[elem], 0) for elem in combo)
+                for combo in sequence
+            )
+            seq_string_cache[cache_key] = codes
+            if len(seq_string_cache) > seq_string_cache_size:
+                seq_string_cache.popitem(last=False)
 
         # Convert each element in sequence of combos to HIDIds
-        hid_ids = []
-        for combo in sequence:
-            new_combo = []
-            for elem in combo:
-                # Lookup uid (usb code) from alias name (used in sequence)
-                new_elem = HIDId('USBCode', int(locale.json()['from_hid_keyboard'][elem], 0), locale)
-                new_combo.append(new_elem)
-            hid_ids.append(new_combo)
+        hid_ids = [
+            [HIDId('USBCode', code, locale) for code in combo]
+            for combo in codes
+        ]
 
         return hid_ids
 
@@ -506,22 +537,13 @@ class Make:
 
         1ms -> 1, ms
         '''
-        # Find ms, us, or s
-        if 'ms' in token:
-            unit = 'ms'
-            num = token.split('m')[0]
-        elif 'us' in token:
-            unit = 'us'
-            num = token.split('u')[0]
-        elif 'ns' in token:
-            unit = 'ns'
-            num = token.split('n')[0]
-        elif 's' in token:
-            unit = 's'
-            num = token.split('s')[0]
-        else:
+        # Split number and ms, us, ns or s unit
+        match = timing_token.match(token)
+        if match is None:
             print("{0} cannot find timing unit in token '{1}'".format(ERROR, token))
+            raise ValueError(token)
 
+        num, unit = match.groups()
         return Time(float(num), unit)
 
     def specifierTiming(timing):
@@ -606,11 +628,8 @@ class Make:
         if start > end:
             start, end = end, start
 
-        # Iterate from start to end, and generate the range
-        values = list(range(start, end + 1))
-
-        # Generate ScanCodeIds
-        return [ScanCodeId(v) for v in values]
+        # Iterate from start to end, and generate ScanCodeIds
+        return [ScanCodeId(v) for v in range(start, end + 1)]
 
     # Range can go from high to low or low to high
     # Warn on 0-9 for USBCodes (as this does not do what one would expect) TODO
@@ -637,16 +656,11 @@ class Make:
         if start > end:
             start, end = end, start
 
-        # Iterate from start to end, and generate the range
-        listRange = list(range(start, end + 1))
-
         # Determine locale
         locale = rangeVals[0].locale
 
-        # Convert each item in the list to a tuple
-        for item in range(len(listRange)):
-            listRange[item] = HIDId(type, listRange[item], locale)
-        return listRange
+        # Iterate from start to end, and generate HIDIds
+        return [HIDId(type, v, locale) for v in range(start, end + 1)]
 
     def usbCode_range(rangeVals):
         '''
@@ -745,7 +759,7 @@ def const(x): return lambda _: x
 def unarg(f): return lambda x: f(*x)
 
 
-def flatten(list): return sum(list, [])
+def flatten(items): return list(itertools.chain.from_iterable(items))
 
 
 def tokenValue(x):
@@ -778,13 +792,66 @@ def tokenTypeOnly(t):
     return some(lambda x: x.type == t)
 
 
-def operator(s): return a(Token('Operator', s)) >> tokenValue
+def tokenTypeDispatch(parsers):
+    '''
+    Returns a parser that picks an alternative using the type of the next token
+
+    Equivalent to an ordered choice (|) of alternatives that each start with a different token type,
+    but only the matching alternative is tried, rather than failing and backtracking through the others
+
+    While parser debug is enabled the ordered choice is tried instead, so the trace still lists every alternative
+
+    @param parsers: Dictionary of token type to parser
+    @return: Parser of the alternative matching the next token
+    '''
+    choice = None
+    for parser in parsers.values():
+        choice = parser if choice is None else choice | parser
 
+    @Parser
+    def _dispatch(tokens, s):
+        if funcparser.debug:
+            return choice.run(tokens, s)
 
-def parenthesis(s): return a(Token('Parenthesis', s)) >> tokenValue
+        if s.pos >= len(tokens):
+            raise NoParseError('no tokens left in the stream', s)
 
+        token = tokens[s.pos]
+        parser = parsers.get(token.type)
+        if parser is None:
+            raise NoParseError('got unexpected token', s, token)
+        return parser.run(tokens, s)
 
-def bracket(s): return a(Token('Bracket', s)) >> tokenValue
+    _dispatch.name = '(%s)' % ' | '.join(parser.name for parser in parsers.values())
+    return _dispatch
+
+
+def literalToken(t, s, convert=None):
+    '''
+    Returns a parser matching a literal token, built once per token type and string
+
+    @param t:       Name of token type
+    @param s:       String of token
+    @param convert: Optional conversion applied to the matched token (always the same for a given token type)
+    @return: Token matching parser
+    '''
+    key = (t, s, funcparser.debug)
+    parser = literal_token_parsers.get(key)
+    if parser is None:
+        parser = a(Token(t, s))
+        if convert is not None:
+            parser = parser >> convert
+        literal_token_parsers[key] = parser
+    return parser
+
+
+def operator(s): return literalToken('Operator', s, tokenValue)
+
+
+def parenthesis(s): return literalToken('Parenthesis', s, tokenValue)
+
+
+def bracket(s): return literalToken('Bracket', s, tokenValue)
 
 
 eol = a(Token('EndOfLine', ';'))
@@ -825,12 +892,7 @@ def oneLayerFlatten(items):
     '''
     Flatten only the top layer (list of lists of ...)
     '''
-    mainList = []
-    for sublist in items:
-        for item in sublist:
-            mainList.append(item)
-
-    return mainList
+    return list(itertools.chain.from_iterable(items))
 
 
 def optionCompression(sequence):
@@ -863,43 +925,19 @@ def optionExpansion(sequences):
     '''
     expandedSequences = []
 
-    # Total number of combinations of the sequence of combos that needs to be generated
-    totalCombinations = 1
-
-    # List of leaf lists, with number of leaves
-    maxLeafList = []
-
-    # Traverse to the leaf nodes, and count the items in each leaf list
-    for sequence in sequences:
-        for combo in sequence:
-            rangeLen = len(combo)
-            totalCombinations *= rangeLen
-            maxLeafList.append(rangeLen)
-
-    # Counter list to keep track of which combination is being generated
-    curLeafList = [0] * len(maxLeafList)
+    # List of leaf lists (ranges), in sequence then combo order
+    leafLists = [combo for sequence in sequences for combo in sequence]
 
     # Generate a list of permuations of the sequence of combos
-    for count in range(0, totalCombinations):
-        expandedSequences.append([])  # Prepare list for adding the new combination
-        pos = 0
+    # The first leaf changes fastest, so product is run over the reversed leaves
+    for permutation in itertools.product(*reversed(leafLists)):
+        leaves = iter(reversed(permutation))
 
         # Traverse sequence of combos to generate permuation
-        for sequence in sequences:
-            expandedSequences[-1].append([])
-            for combo in sequence:
-                expandedSequences[-1][-1].append(combo[curLeafList[pos]])
-                pos += 1
-
-        # Increment combination tracker
-        for leaf in range(0, len(curLeafList)):
-            curLeafList[leaf] += 1
-
-            # Reset this position, increment next position (if it exists), then stop
-            if curLeafList[leaf] >= maxLeafList[leaf]:
-                curLeafList[leaf] = 0
-                if leaf + 1 < len(curLeafList):
-                    curLeafList[leaf + 1] += 1
+        expandedSequences.append([
+            [next(leaves) for combo in sequence]
+            for sequence in sequences
+        ])
 
     return expandedSequences
 
@@ -952,10 +990,10 @@ seqStringR = tokenTypeOnly('SequenceStringR') >> Make.seqStringR >> optionCompre
 unseqString = tokenType('SequenceString') >> Make.unseqString  # For use with variables
 
 
-def colRowOperator(s): return a(Token('ColRowOperator', s))
+def colRowOperator(s): return literalToken('ColRowOperator', s)
 
 
-def relCROperator(s): return a(Token('RelCROperator', s))
+def relCROperator(s): return literalToken('RelCROperator', s)
 
 
 pixelOperator = tokenType('PixelOperator')
@@ -1037,7 +1075,17 @@ usbCode_expanded = skip(usbCode_start) + usbCode_innerList + skip(code_end) + ma
 usbCode_elem = usbCode + maybe(specifier_list) >> unarg(Make.specifierUnroll)
 
 # HID Codes
-hidCode_elem = usbCode_expanded | usbCode_elem | sysCode_expanded | sysCode_elem | consCode_expanded | consCode_elem | indCode_expanded | indCode_elem
+# Each alternative starts with a distinct token type, dispatch on it directly
+hidCode_elem = tokenTypeDispatch({
+    'USBCodeStart': usbCode_expanded,
+    'USBCode': usbCode_elem,
+    'SysCodeStart': sysCode_expanded,
+    'SysCode': sysCode_elem,
+    'ConsCodeStart': consCode_expanded,
+    'ConsCode': consCode_elem,
+    'IndicatorStart': indCode_expanded,
+    'IndCode': indCode_elem,
+})
 
 # UTF-8
 utf8_elem = (codePoint | utf8str) + maybe(specifier_list) >> unarg(Make.specifierUnroll)
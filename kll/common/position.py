@@ -55,6 +55,9 @@ class Position:
     ry = None
     rz = None
 
+    # Cached strPosition output
+    _position_str = None
+
     def __init(self):
         # Set all the _parameters to None
         for param in self._parameters:
@@ -104,6 +107,9 @@ class Position:
             if getattr(self, name) is None:
                 setattr(self, name, value)
 
+        self._position_str = None
+        self.clear_cache()
+
     def updatePositions(self, position):
         '''
         Using another Position object update positions
@@ -116,23 +122,33 @@ class Position:
             if value is not None:
                 setattr(self, param, value)
 
+        self._position_str = None
+        self.clear_cache()
+
+    def clear_cache(self):
+        '''
+        Invalidate any cached string representations
+
+        Overridden by Id when Position is used with multiple inheritance
+        '''
+        pass
+
     def strPosition(self):
         '''
         __repr__ of Position when multiple inheritance is used
         '''
-        output = ""
+        if self._position_str is not None:
+            return self._position_str
 
         # Check each of the position parameters, only show the ones that are not None
-        count = 0
+        output = []
         for param in self._parameters:
             value = getattr(self, param)
             if value is not None:
-                if count > 0:
-                    output += ","
-                output += "{0}:{1}".format(param, value)
-                count += 1
+                output.append("{0}:{1}".format(param, value))
 
-        return output
+        self._position_str = ",".join(output)
+        return self._position_str
 
     def json(self):
         '''
@@ -38,6 +38,7 @@ class Time:
     '''
     Time parameter
     '''
+    __slots__ = ('time', 'unit')
 
     def __init__(self, time, unit):
         self.time = time
@@ -58,6 +59,9 @@ class Schedule:
     def __init__(self):
         self.parameters = None
 
+        # Cached strSchedule output
+        self._schedule_str = None
+
     def setSchedule(self, parameters):
         '''
         Applies given list of Schedule Parameters to Schedule
@@ -77,17 +81,28 @@ class Schedule:
             param.checkParam()
         self.parameters = parameters
 
+        # Schedule is part of the string representation of the parent
+        self._schedule_str = None
+        self.clear_cache()
+
+    def clear_cache(self):
+        '''
+        Invalidate any cached string representations
+
+        Overridden by Id when Schedule is used with multiple inheritance
+        '''
+        pass
+
     def strSchedule(self, kll=False):
         '''
         __repr__ of Schedule when multiple inheritance is used
         '''
-        output = ""
-        if self.parameters is not None:
-            for index, param in enumerate(self.parameters):
-                if index > 0:
-                    output += ","
-                output += "{0}".format(param.kllify())
-        return output
+        if self._schedule_str is None:
+            if self.parameters is None:
+                self._schedule_str = ""
+            else:
+                self._schedule_str = ",".join(str(param.kllify()) for param in self.parameters)
+        return self._schedule_str
 
     def json(self):
         '''
@@ -195,14 +210,22 @@ class ScheduleParam:
             output += "{0}".format(self.timing)
         return output
 
+    def strStateTiming(self):
+        '''
+        <state>:<timing> representation used by the typed ScheduleParams
+        '''
+        if self.timing is None:
+            return "" if self.state is None else str(self.state)
+        if self.state is None:
+            return str(self.timing)
+        return "{0}:{1}".format(self.state, self.timing)
+
     def __repr__(self):
-        output = ""
         if self.state is None and self.timing is not None:
-            output += "{0}".format(self.timing)
-        else:
-            output += "??"
-            print("{0} Unknown ScheduleParam state '{1}'".format(ERROR, self.state))
-        return output
+            return str(self.timing)
+
+        print("{0} Unknown ScheduleParam state '{1}'".format(ERROR, self.state))
+        return "??"
 
 
 class ButtonScheduleParam(ScheduleParam):
@@ -222,20 +245,13 @@ class ButtonScheduleParam(ScheduleParam):
     '''
 
     def __repr__(self):
-        output = ""
-        if self.state is not None:
-            output += "{0}".format(self.state)
-        if self.state is not None and self.timing is not None:
-            output += ":"
-        if self.timing is not None:
-            output += "{0}".format(self.timing)
-        return output
+        return self.strStateTiming()
 
     def kllify(self):
         '''
         KLL representation of object
         '''
-        return "{0}".format(self)
+        return str(self)
 
 
 class AnalogScheduleParam(ScheduleParam):
@@ -249,14 +265,7 @@ class AnalogScheduleParam(ScheduleParam):
     '''
 
     def __repr__(self):
-        output = ""
-        if self.state is not None:
-            output += "{0}".format(self.state)
-        if self.state is not None and self.timing is not None:
-            output += ":"
-        if self.timing is not None:
-            output += "{0}".format(self.timing)
-        return output
+        return self.strStateTiming()
 
     def kllify(self):
         '''
@@ -280,20 +289,13 @@ class IndicatorScheduleParam(ScheduleParam):
     '''
 
     def __repr__(self):
-        output = ""
-        if self.state is not None:
-            output += "{0}".format(self.state)
-        if self.state is not None and self.timing is not None:
-            output += ":"
-        if self.timing is not None:
-            output += "{0}".format(self.timing)
-        return output
+        return self.strStateTiming()
 
     def kllify(self):
         '''
         KLL representation of object
         '''
-        return "{0}".format(self)
+        return str(self)
 
 
 class AnimationScheduleParam(ScheduleParam):
@@ -310,17 +312,10 @@ class AnimationScheduleParam(ScheduleParam):
     '''
 
     def __repr__(self):
-        output = ""
-        if self.state is not None:
-            output += "{0}".format(self.state)
-        if self.state is not None and self.timing is not None:
-            output += ":"
-        if self.timing is not None:
-            output += "{0}".format(self.timing)
-        return output
+        return self.strStateTiming()
 
     def kllify(self):
         '''
         KLL representation of object
         '''
-        return "{0}".format(self)
+        return str(self)
@@ -53,6 +53,12 @@ WARNING = '\033[5;1;33mWARNING\033[0m:'
 
 ansi_escape = re.compile(r'\x1b[^m]*m')
 
+# Id types that are added to the trigger lists
+trigger_list_types = frozenset(['Animation', 'IndCode', 'GenericTrigger', 'Layer', 'LayerLock', 'LayerShift', 'LayerLatch', 'ScanCode'])
+
+# Id types that hold UTF-8 strings
+utf8_types = frozenset(['UTF8State', 'UTF8Text'])
+
 
 ### Classes ###
 
@@ -1051,7 +1057,7 @@ class OperationClassificationStage(Stage):
 
             # Append expression
             kll_context.expressions.append(
-                expression.Expression(tokens[index], tokens[index + 1], tokens[index + 2], kll_context)
+                expression.make_expression(tokens[index], tokens[index + 1], tokens[index + 2], kll_context)
             )
 
         return ret
@@ -2559,11 +2565,11 @@ class DataAnalysisStage(Stage):
                     # Get list of ids from expression
                     for identifier in sub_expr.trigger_id_list():
                         # If animation, set the uid first by doing a uid lookup
-                        if identifier.type in ['Animation']:
+                        if identifier.type == 'Animation':
                             identifier.uid = self.animation_uid_lookup[identifier.name]
 
                         # Append each uid to Trigger List
-                        if identifier.type in ['Animation', 'IndCode', 'GenericTrigger', 'Layer', 'LayerLock', 'LayerShift', 'LayerLatch', 'ScanCode']:
+                        if identifier.type in trigger_list_types:
                             # In order to uniquely identify each trigger, using full kll expression as lookup
                             trigger_index = self.trigger_index_lookup[sub_expr.kllify()]
 
@@ -2604,7 +2610,7 @@ class DataAnalysisStage(Stage):
                     # Get list of ids from expression
                     for identifier in sub_expr.trigger_id_list():
                         # Determine if GenericTrigger
-                        if identifier.type in ['GenericTrigger'] and identifier.idcode == 21:
+                        if identifier.type == 'GenericTrigger' and identifier.idcode == 21:
                             # If uid not in rotation_map, add it
                             if identifier.uid not in self.rotation_map.keys():
                                 self.rotation_map[identifier.uid] = 0
@@ -2884,7 +2890,7 @@ class DataAnalysisStage(Stage):
                     # Get list of ids from expression
                     for identifier in sub_expr.result_id_list():
                         # Determine if UTF8Id
-                        if identifier.type in ['UTF8State', 'UTF8Text']:
+                        if identifier.type in utf8_types:
                             # Just overwrite as it will be the same value
                             sorting_list.append(identifier.uid)
 
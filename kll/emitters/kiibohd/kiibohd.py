@@ -688,20 +688,20 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
         @param aniframe: Animation frame data
         '''
         # Frame set header
-        self.fill_dict['AnimationFrames'] += "//// {0} Animation Frame Set ////\n".format(
+        self.fill_dict['AnimationFrames'].append("//// {0} Animation Frame Set ////\n".format(
             name
-        )
-        self.fill_dict['AnimationFrames'] += "const uint8_t *{0}_frames[] = {{".format(
+        ))
+        self.fill_dict['AnimationFrames'].append("const uint8_t *{0}_frames[] = {{".format(
             name
-        )
+        ))
 
         # Generate entry for each of the frames (even blank inbetweens)
         for index in range(1, aniframe + 1):
-            self.fill_dict['AnimationFrames'] += "\n\t{0}_frame{1},".format(
+            self.fill_dict['AnimationFrames'].append("\n\t{0}_frame{1},".format(
                 name,
                 index
-            )
-        self.fill_dict['AnimationFrames'] += "\n\t0\n};\n\n\n"
+            ))
+        self.fill_dict['AnimationFrames'].append("\n\t0\n};\n\n\n")
 
     def animation_modifier_set(self, animation, name):
         '''
@@ -981,23 +981,23 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 partialLayersInfo += "//     {0}\n//       {1}\n".format(pair[0], pair[1])
 
         ## Information ##
-        self.fill_dict['Information'] = "// This file was generated by the kll compiler, DO NOT EDIT.\n"
-        self.fill_dict['Information'] += "// Generation Date:    {0}\n".format(date.today())
-        self.fill_dict['Information'] += "// KLL Emitter:        {0}\n".format(
+        self.fill_dict['Information'] = ["// This file was generated by the kll compiler, DO NOT EDIT.\n"]
+        self.fill_dict['Information'].append("// Generation Date:    {0}\n".format(date.today()))
+        self.fill_dict['Information'].append("// KLL Emitter:        {0}\n".format(
                 self.control.stage('CompilerConfigurationStage').emitter
-        )
-        self.fill_dict['Information'] += "// KLL Version:        {0}\n".format(self.control.version)
-        self.fill_dict['Information'] += "// KLL Git Changes:{0}".format(gitChangesStr)
-        self.fill_dict['Information'] += "// Compiler arguments:\n{0}".format(compilerArgs)
-        self.fill_dict['Information'] += "//\n"
-        self.fill_dict['Information'] += "// - Configuration File -\n{0}".format(configLayoutInfo)
-        self.fill_dict['Information'] += "// - Generic Files -\n{0}".format(genericLayoutInfo)
-        self.fill_dict['Information'] += "// - Base Layer -\n{0}".format(baseLayoutInfo)
-        self.fill_dict['Information'] += "// - Default Layer -\n{0}".format(defaultLayerInfo)
-        self.fill_dict['Information'] += "// - Partial Layers -\n{0}".format(partialLayersInfo)
+        ))
+        self.fill_dict['Information'].append("// KLL Version:        {0}\n".format(self.control.version))
+        self.fill_dict['Information'].append("// KLL Git Changes:{0}".format(gitChangesStr))
+        self.fill_dict['Information'].append("// Compiler arguments:\n{0}".format(compilerArgs))
+        self.fill_dict['Information'].append("//\n")
+        self.fill_dict['Information'].append("// - Configuration File -\n{0}".format(configLayoutInfo))
+        self.fill_dict['Information'].append("// - Generic Files -\n{0}".format(genericLayoutInfo))
+        self.fill_dict['Information'].append("// - Base Layer -\n{0}".format(baseLayoutInfo))
+        self.fill_dict['Information'].append("// - Default Layer -\n{0}".format(defaultLayerInfo))
+        self.fill_dict['Information'].append("// - Partial Layers -\n{0}".format(partialLayersInfo))
 
         ## Defines ##
-        self.fill_dict['Defines'] = ""
+        self.fill_dict['Defines'] = []
 
         # Iterate through defines and lookup the variables
         defines = full_context.query('NameAssociationExpression', 'Define')
@@ -1007,10 +1007,10 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 # TODO Handle arrays
                 if not isinstance(variables.data[dvalue.name].value, list):
                     value = variables.data[dvalue.name].value.replace('\n', ' \\\n')
-                    self.fill_dict['Defines'] += "\n#define {0} {1}".format(
+                    self.fill_dict['Defines'].append("\n#define {0} {1}".format(
                         dvalue.association,
                         value,
-                    )
+                    ))
                     defines_json[dvalue.name] = {
                         'name' : dvalue.association,
                         'value' : value,
@@ -1019,9 +1019,10 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 print("{0} '{1}' not defined...".format(WARNING, dvalue.name))
 
         ## Capabilities ##
-        self.fill_dict['CapabilitiesFuncDecl'] = ""
-        self.fill_dict['CapabilitiesList'] = "const Capability CapabilitiesList[] = {\n"
-        self.fill_dict['CapabilitiesIndices'] = "typedef enum CapabilityIndex {\n"
+        # Build each capability table as a list of lines
+        capabilities_func_decl = []
+        capabilities_list = ["const Capability CapabilitiesList[] = {\n"]
+        capabilities_indices = ["typedef enum CapabilityIndex {\n"]
 
         # Sorted by C Function name
         self.capabilities = full_context.query('NameAssociationExpression', 'Capability')
@@ -1049,20 +1050,20 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
             argByteWidth = dvalue.association.total_arg_bytes()
             features = "CapabilityFeature_Safe" if dkey in safe_capabilities else "CapabilityFeature_None"
 
-            self.fill_dict['CapabilitiesList'] += "\t/* {3} {4} */\n\t{{ {0}, {1}, {2} }},\n".format(
+            capabilities_list.append("\t/* {3} {4} */\n\t{{ {0}, {1}, {2} }},\n".format(
                 funcName,
                 argByteWidth,
                 features,
                 count,
                 dkey,
-            )
+            ))
             if self.enable_capv2:
-                self.fill_dict['CapabilitiesFuncDecl'] += \
-                    "void {0}( TriggerMacro *trigger, uint16_t state, uint8_t stateType, uint8_t *args );\n".format(funcName)
+                capabilities_func_decl.append(
+                    "void {0}( TriggerMacro *trigger, uint16_t state, uint8_t stateType, uint8_t *args );\n".format(funcName))
             else:
-                self.fill_dict['CapabilitiesFuncDecl'] += \
-                    "void {0}( TriggerMacro *trigger, uint8_t state, uint8_t stateType, uint8_t *args );\n".format(funcName)
-            self.fill_dict['CapabilitiesIndices'] += "\t{0}_index,\n".format(funcName)
+                capabilities_func_decl.append(
+                    "void {0}( TriggerMacro *trigger, uint8_t state, uint8_t stateType, uint8_t *args );\n".format(funcName))
+            capabilities_indices.append("\t{0}_index,\n".format(funcName))
 
             # Add to json
             capabilities_json[dkey] = {
@@ -1082,8 +1083,12 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
             self.capabilities_index[dkey] = count
             count += 1
 
-        self.fill_dict['CapabilitiesList'] += "};"
-        self.fill_dict['CapabilitiesIndices'] += "} CapabilityIndex;"
+        capabilities_list.append("};")
+        capabilities_indices.append("} CapabilityIndex;")
+
+        self.fill_dict['CapabilitiesFuncDecl'] = capabilities_func_decl
+        self.fill_dict['CapabilitiesList'] = capabilities_list
+        self.fill_dict['CapabilitiesIndices'] = capabilities_indices
 
         # Validate that we have the required capabilities
         for key, elem in self.required_capabilities.items():
@@ -1097,12 +1102,12 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                     ))
 
         ## Results Macros ##
-        self.fill_dict['ResultMacros'] = ""
+        self.fill_dict['ResultMacros'] = []
 
         # Iterate through each of the indexed result macros
         # This is the full set of result macros, layers are handled separately
         for index, result in enumerate(result_index):
-            self.fill_dict['ResultMacros'] += "Guide_RM( {0} ) = {{ ".format(index)
+            self.fill_dict['ResultMacros'].append("Guide_RM( {0} ) = {{ ".format(index))
 
             # Add the result macro capability index guide (including capability arguments)
             # See kiibohd controller Macros/PartialMap/kll.h for exact formatting details
@@ -1111,43 +1116,43 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 # Needed for USB behaviour, otherwise, repeated keys will not work
                 if seq_index > 0:
                     # <single element>, <usbCodeSend capability>, <USB Code 0x00>
-                    self.fill_dict['ResultMacros'] += "{0}, ".format(self.result_combo_conversion())
+                    self.fill_dict['ResultMacros'].append("{0}, ".format(self.result_combo_conversion()))
 
                 # Iterate over each combo (element of the sequence)
                 for com_index, combo in enumerate(sequence):
                     # Convert capability and arguments to output spring
-                    self.fill_dict['ResultMacros'] += "{0}, ".format(self.result_combo_conversion(combo))
+                    self.fill_dict['ResultMacros'].append("{0}, ".format(self.result_combo_conversion(combo)))
 
             # If sequence is longer than 1, append a sequence spacer at the end of the sequence
             # Required by USB to end at sequence without holding the key down
             if len(result[0].results[0]) > 1:
                 # <single element>, <usbCodeSend capability>, <USB Code 0x00>
-                self.fill_dict['ResultMacros'] += "{0}, ".format(self.result_combo_conversion())
+                self.fill_dict['ResultMacros'].append("{0}, ".format(self.result_combo_conversion()))
 
             # Add list ending 0 and end of list
-            self.fill_dict['ResultMacros'] += "0 }}; // {0}\n".format(
+            self.fill_dict['ResultMacros'].append("0 }}; // {0}\n".format(
                 result[0].result_str()
-            )
-        self.fill_dict['ResultMacros'] = self.fill_dict['ResultMacros'][:-1]  # Remove last newline
+            ))
+        self.trim_fill('ResultMacros', 1)  # Remove last newline
 
         ## Result Macro List ##
-        self.fill_dict['ResultMacroList'] = "const ResultMacro ResultMacroList[] = {\n"
+        self.fill_dict['ResultMacroList'] = ["const ResultMacro ResultMacroList[] = {\n"]
 
         # Iterate through each of the result macros
         for index, result in enumerate(result_index):
             # Include debug string for each result macro
-            self.fill_dict['ResultMacroList'] += "\tDefine_RM( {0} ), // {1}\n".format(
+            self.fill_dict['ResultMacroList'].append("\tDefine_RM( {0} ), // {1}\n".format(
                 index,
                 result[0].result_str()
-            )
-        self.fill_dict['ResultMacroList'] += "};"
+            ))
+        self.fill_dict['ResultMacroList'].append("};")
 
         ## Trigger Macros ##
-        self.fill_dict['TriggerMacros'] = ""
+        self.fill_dict['TriggerMacros'] = []
 
         # Iterate through each of the trigger macros
         for index, trigger in enumerate(trigger_index_reduced):
-            self.fill_dict['TriggerMacros'] += "Guide_TM( {0} ) = {{ ".format(index)
+            self.fill_dict['TriggerMacros'].append("Guide_TM( {0} ) = {{ ".format(index))
 
             # Add the trigger macro scan code guide
             # See kiibohd controller Macros/PartialMap/kll.h for exact formatting details
@@ -1157,29 +1162,29 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 # For each combo, add the length, key type, key state and scan code
                 for com_index, combo in enumerate(sequence):
                     # Convert each combo into an array of bytes
-                    self.fill_dict['TriggerMacros'] += "{0}, ".format(
+                    self.fill_dict['TriggerMacros'].append("{0}, ".format(
                         self.trigger_combo_conversion(combo)
-                    )
+                    ))
 
             # Add list ending 0 and end of list
-            self.fill_dict['TriggerMacros'] += "0 }}; // {0}\n".format(
+            self.fill_dict['TriggerMacros'].append("0 }}; // {0}\n".format(
                 trigger[0].trigger_str()
-            )
-        self.fill_dict['TriggerMacros'] = self.fill_dict['TriggerMacros'][:-1]  # Remove last newline
+            ))
+        self.trim_fill('TriggerMacros', 1)  # Remove last newline
 
         ## Trigger Macro List ##
-        self.fill_dict['TriggerMacroList'] = "const TriggerMacro TriggerMacroList[] = {\n"
+        self.fill_dict['TriggerMacroList'] = ["const TriggerMacro TriggerMacroList[] = {\n"]
 
         # Iterate through each of the trigger macros
         for index, trigger in enumerate(trigger_index):
             # Use TriggerMacro Index, and the corresponding ResultMacro Index, including debug string
-            self.fill_dict['TriggerMacroList'] += "\t/* {3} */ Define_TM( {0}, {1} ), // {2}\n".format(
+            self.fill_dict['TriggerMacroList'].append("\t/* {3} */ Define_TM( {0}, {1} ), // {2}\n".format(
                 trigger_index_reduced_lookup[trigger[0].sort_trigger()],
                 result_index_lookup[trigger[0].sort_result()],
                 trigger[0],
                 index
-            )
-        self.fill_dict['TriggerMacroList'] += "};"
+            ))
+        self.fill_dict['TriggerMacroList'].append("};")
 
         ## Trigger Macro Record ##
         self.fill_dict['TriggerMacroRecord'] = "TriggerMacroRecord TriggerMacroRecordList[ TriggerMacroNum ];"
@@ -1188,12 +1193,12 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
         self.fill_dict['MaxScanCode'] = "#define MaxScanCode 0x{0:X}".format(max(max_scan_code))
 
         ## Interconnect ScanCode Offset List ##
-        self.fill_dict['ScanCodeInterconnectOffsetList'] = "const uint8_t InterconnectOffsetList[] = {\n"
+        self.fill_dict['ScanCodeInterconnectOffsetList'] = ["const uint8_t InterconnectOffsetList[] = {\n"]
         for index, offset in enumerate(interconnect_scancode_offsets):
-            self.fill_dict['ScanCodeInterconnectOffsetList'] += "\t0x{0:02X},\n".format(
+            self.fill_dict['ScanCodeInterconnectOffsetList'].append("\t0x{0:02X},\n".format(
                 offset
-            )
-        self.fill_dict['ScanCodeInterconnectOffsetList'] += "};"
+            ))
+        self.fill_dict['ScanCodeInterconnectOffsetList'].append("};")
 
         ## Max Interconnect Nodes ##
         self.fill_dict['InterconnectNodeMax'] = "#define InterconnectNodeMax 0x{0:X}\n".format(
@@ -1201,8 +1206,8 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
         )
 
         ## Default Layer and Default Layer Scan Map ##
-        self.fill_dict['DefaultLayerTriggerList'] = ""
-        self.fill_dict['DefaultLayerScanMap'] = "const nat_ptr_t *default_scanMap[] = { \n"
+        self.fill_dict['DefaultLayerTriggerList'] = []
+        self.fill_dict['DefaultLayerScanMap'] = ["const nat_ptr_t *default_scanMap[] = { \n"]
 
         # Iterate over triggerList and generate a C trigger array for the default map and default map array
         for index, trigger_list in enumerate(trigger_lists[0][min_scan_code[0]:]):
@@ -1211,27 +1216,27 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 trigger_list_len = len(trigger_list)
 
             # Generate ScanCode index and triggerList length
-            self.fill_dict['DefaultLayerTriggerList'] += "Define_TL( default, 0x{0:02X} ) = {{ {1}".format(
+            self.fill_dict['DefaultLayerTriggerList'].append("Define_TL( default, 0x{0:02X} ) = {{ {1}".format(
                 index,
                 trigger_list_len
-            )
+            ))
 
             # Add scanCode trigger list to Default Layer Scan Map
-            self.fill_dict['DefaultLayerScanMap'] += "default_tl_0x{0:02X}, ".format(index)
+            self.fill_dict['DefaultLayerScanMap'].append("default_tl_0x{0:02X}, ".format(index))
 
             # Add each item of the trigger list
             if trigger_list_len > 0:
                 for trigger_code in trigger_list:
-                    self.fill_dict['DefaultLayerTriggerList'] += ", {0}".format(trigger_code)
+                    self.fill_dict['DefaultLayerTriggerList'].append(", {0}".format(trigger_code))
 
-            self.fill_dict['DefaultLayerTriggerList'] += " };\n"
-        self.fill_dict['DefaultLayerTriggerList'] = self.fill_dict['DefaultLayerTriggerList'][:-1]  # Remove last newline
-        self.fill_dict['DefaultLayerScanMap'] = self.fill_dict['DefaultLayerScanMap'][:-2]  # Remove last comma and space
-        self.fill_dict['DefaultLayerScanMap'] += "\n};"
+            self.fill_dict['DefaultLayerTriggerList'].append(" };\n")
+        self.trim_fill('DefaultLayerTriggerList', 1)  # Remove last newline
+        self.trim_fill('DefaultLayerScanMap', 2)  # Remove last comma and space
+        self.fill_dict['DefaultLayerScanMap'].append("\n};")
 
         ## Partial Layers and Partial Layer Scan Maps ##
-        self.fill_dict['PartialLayerTriggerLists'] = ""
-        self.fill_dict['PartialLayerScanMaps'] = ""
+        self.fill_dict['PartialLayerTriggerLists'] = []
+        self.fill_dict['PartialLayerScanMaps'] = []
 
         # Iterate over each of the layers, excluding the default layer
         for lay_index, layer in enumerate(trigger_lists):
@@ -1240,51 +1245,51 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 continue
 
             # Prepare each layer
-            self.fill_dict['PartialLayerScanMaps'] += "// Partial Layer {0}\n".format(lay_index)
-            self.fill_dict['PartialLayerScanMaps'] += "const nat_ptr_t *layer{0}_scanMap[] = {{ \n".format(lay_index)
-            self.fill_dict['PartialLayerTriggerLists'] += "// Partial Layer {0}\n".format(lay_index)
+            self.fill_dict['PartialLayerScanMaps'].append("// Partial Layer {0}\n".format(lay_index))
+            self.fill_dict['PartialLayerScanMaps'].append("const nat_ptr_t *layer{0}_scanMap[] = {{ \n".format(lay_index))
+            self.fill_dict['PartialLayerTriggerLists'].append("// Partial Layer {0}\n".format(lay_index))
 
             # Iterate over triggerList and generate a C trigger array for the layer
             for trig_index, trigger_list in enumerate(layer[min_scan_code[lay_index]:max_scan_code[lay_index] + 1]):
                 # Generate ScanCode index and layer
-                self.fill_dict['PartialLayerTriggerLists'] += \
+                self.fill_dict['PartialLayerTriggerLists'].append(
                     "Define_TL( layer{0}, 0x{1:02X} ) = {{".format(
                             lay_index,
                             trig_index,
-                )
+                ))
 
                 # TriggerList length
                 if trigger_list is not None:
-                    self.fill_dict['PartialLayerTriggerLists'] += " {0}".format(
+                    self.fill_dict['PartialLayerTriggerLists'].append(" {0}".format(
                         len(trigger_list)
-                    )
+                    ))
 
                 # Blank trigger (Dropped), zero length
                 else:
-                    self.fill_dict['PartialLayerTriggerLists'] += " 0"
+                    self.fill_dict['PartialLayerTriggerLists'].append(" 0")
 
                 # Add scanCode trigger list to Default Layer Scan Map
-                self.fill_dict['PartialLayerScanMaps'] += "layer{0}_tl_0x{1:02X}, ".format(
+                self.fill_dict['PartialLayerScanMaps'].append("layer{0}_tl_0x{1:02X}, ".format(
                     lay_index,
                     trig_index,
-                )
+                ))
 
                 # Add each item of the trigger list
                 if trigger_list is not None:
                     for trigger_code in trigger_list:
-                        self.fill_dict['PartialLayerTriggerLists'] += ", {0}".format(
+                        self.fill_dict['PartialLayerTriggerLists'].append(", {0}".format(
                             trigger_code
-                        )
+                        ))
 
-                self.fill_dict['PartialLayerTriggerLists'] += " };\n"
-            self.fill_dict['PartialLayerTriggerLists'] += "\n"
-            self.fill_dict['PartialLayerScanMaps'] = self.fill_dict['PartialLayerScanMaps'][:-2]  # Remove last comma and space
-            self.fill_dict['PartialLayerScanMaps'] += "\n};\n\n"
-        self.fill_dict['PartialLayerTriggerLists'] = self.fill_dict['PartialLayerTriggerLists'][:-2]  # Remove last 2 newlines
-        self.fill_dict['PartialLayerScanMaps'] = self.fill_dict['PartialLayerScanMaps'][:-2]  # Remove last 2 newlines
+                self.fill_dict['PartialLayerTriggerLists'].append(" };\n")
+            self.fill_dict['PartialLayerTriggerLists'].append("\n")
+            self.trim_fill('PartialLayerScanMaps', 2)  # Remove last comma and space
+            self.fill_dict['PartialLayerScanMaps'].append("\n};\n\n")
+        self.trim_fill('PartialLayerTriggerLists', 2)  # Remove last 2 newlines
+        self.trim_fill('PartialLayerScanMaps', 2)  # Remove last 2 newlines
 
         ## Layer Index List ##
-        self.fill_dict['LayerIndexList'] = "const Layer LayerIndex[] = {\n"
+        self.fill_dict['LayerIndexList'] = ["const Layer LayerIndex[] = {\n"]
 
         # Iterate over each layer, adding it to the list
         for layer, layer_context in enumerate(reduced_contexts):
@@ -1302,10 +1307,10 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
 
             # Default map is a special case, always the first index
             if layer == 0:
-                self.fill_dict['LayerIndexList'] += '\tLayer_IN( default_scanMap, "D: {1}", 0x{0:02X} ),\n'.format(min_scan_code[layer], stack_name)
+                self.fill_dict['LayerIndexList'].append('\tLayer_IN( default_scanMap, "D: {1}", 0x{0:02X} ),\n'.format(min_scan_code[layer], stack_name))
             else:
-                self.fill_dict['LayerIndexList'] += '\tLayer_IN( layer{0}_scanMap, "{0}: {2}", 0x{1:02X} ),\n'.format(layer, min_scan_code[layer], stack_name)
-        self.fill_dict['LayerIndexList'] += "};"
+                self.fill_dict['LayerIndexList'].append('\tLayer_IN( layer{0}_scanMap, "{0}: {2}", 0x{1:02X} ),\n'.format(layer, min_scan_code[layer], stack_name))
+        self.fill_dict['LayerIndexList'].append("};")
 
         ## Layer State ##
         self.fill_dict['LayerState'] = "LayerStateType LayerState[ LayerNum ];"
@@ -1337,40 +1342,40 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
         max_rotations = 0
         if rotation_map.keys():
             max_rotations = max(rotation_map.keys())
-        self.fill_dict['RotationParameters'] = 'const uint8_t Rotation_MaxParameter[] = {\n'
+        self.fill_dict['RotationParameters'] = ['const uint8_t Rotation_MaxParameter[] = {\n']
         cur_rotation = 0
         for key, entry in sorted(rotation_map.items()):
             # Make sure that we also fill in 0 for any non-existent rotations
             while cur_rotation != key:
-                self.fill_dict['RotationParameters'] += '\t{}, // {}\n'.format(
+                self.fill_dict['RotationParameters'].append('\t{}, // {}\n'.format(
                     0,
                     cur_rotation,
-                )
+                ))
                 cur_rotation += 1
-            self.fill_dict['RotationParameters'] += '\t{}, // {}\n'.format(
+            self.fill_dict['RotationParameters'].append('\t{}, // {}\n'.format(
                 entry,
                 key,
-            )
+            ))
             cur_rotation += 1
-        self.fill_dict['RotationParameters'] += '};'
+        self.fill_dict['RotationParameters'].append('};')
 
         ## Pixel Buffer Setup ##
         # Only add sections if Pixel Buffer is defined
         self.use_pixel_map = 'Pixel_Buffer_Size' in defines.data.keys()
-        self.fill_dict['AnimationList'] = ""
+        self.fill_dict['AnimationList'] = []
         if self.use_pixel_map:
-            self.fill_dict['PixelBufferSetup'] = "PixelBuf Pixel_Buffers[] = {\n"
+            self.fill_dict['PixelBufferSetup'] = ["PixelBuf Pixel_Buffers[] = {\n"]
 
             # Lookup number of buffers
             bufsize = len(variables.data[defines.data['Pixel_Buffer_Size'].name].value)
             for index in range(bufsize):
-                self.fill_dict['PixelBufferSetup'] += "\tPixelBufElem( {0}, {1}, {2}, {3} ),\n".format(
+                self.fill_dict['PixelBufferSetup'].append("\tPixelBufElem( {0}, {1}, {2}, {3} ),\n".format(
                     variables.data[defines.data['Pixel_Buffer_Length'].name].value[index],
                     variables.data[defines.data['Pixel_Buffer_Width'].name].value[index],
                     variables.data[defines.data['Pixel_Buffer_Size'].name].value[index],
                     variables.data[defines.data['Pixel_Buffer_Buffer'].name].value[index],
-                )
-            self.fill_dict['PixelBufferSetup'] += "};"
+                ))
+            self.fill_dict['PixelBufferSetup'].append("};")
 
             # Compute total number of channels
             totalchannels = "{0} + {1}".format(
@@ -1381,32 +1386,32 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
             # Only include if defined
             # XXX (HaaTa) This has to be done to make sure KLL compiler is still compatible with older KLL files
             if 'LED_Buffer_Size' in variables.data.keys():
-                self.fill_dict['PixelBufferSetup'] += "\nPixelBuf LED_Buffers[] = {\n"
+                self.fill_dict['PixelBufferSetup'].append("\nPixelBuf LED_Buffers[] = {\n")
 
                 # Lookup number of buffers (LED)
                 ledbufsize = len(variables.data[defines.data['LED_Buffer_Size'].name].value)
                 for index in range(ledbufsize):
-                    self.fill_dict['PixelBufferSetup'] += "\tPixelBufElem( {0}, {1}, {2}, {3} ),\n".format(
+                    self.fill_dict['PixelBufferSetup'].append("\tPixelBufElem( {0}, {1}, {2}, {3} ),\n".format(
                         variables.data[defines.data['LED_Buffer_Length'].name].value[index],
                         variables.data[defines.data['LED_Buffer_Width'].name].value[index],
                         variables.data[defines.data['LED_Buffer_Size'].name].value[index],
                         variables.data[defines.data['LED_Buffer_Buffer'].name].value[index],
-                    )
-                self.fill_dict['PixelBufferSetup'] += "};"
+                    ))
+                self.fill_dict['PixelBufferSetup'].append("};")
 
                 # Add LED fade group(s)
-                self.fill_dict['PixelFadeConfig'] = ""
+                self.fill_dict['PixelFadeConfig'] = []
                 ledgroupsize = len(variables.data[defines.data['KLL_LED_FadeGroup'].name].value)
                 for index in range(ledgroupsize):
-                    self.fill_dict['PixelFadeConfig'] += "const uint16_t Pixel_LED_DefaultFadeGroup{}[] = {{\n".format(
+                    self.fill_dict['PixelFadeConfig'].append("const uint16_t Pixel_LED_DefaultFadeGroup{}[] = {{\n".format(
                         index
-                    )
+                    ))
                     data = variables.data[defines.data['KLL_LED_FadeGroup'].name].value[index]
                     if data != "":
-                        self.fill_dict['PixelFadeConfig'] += "\t{}\n".format(data)
-                    self.fill_dict['PixelFadeConfig'] += "};\n"
+                        self.fill_dict['PixelFadeConfig'].append("\t{}\n".format(data))
+                    self.fill_dict['PixelFadeConfig'].append("};\n")
 
-                self.fill_dict['PixelFadeConfig'] += "const PixelLEDGroupEntry Pixel_LED_DefaultFadeGroups[] = {\n"
+                self.fill_dict['PixelFadeConfig'].append("const PixelLEDGroupEntry Pixel_LED_DefaultFadeGroups[] = {\n")
                 for index in range(ledgroupsize):
                     # Count number of elements
                     data = variables.data[defines.data['KLL_LED_FadeGroup'].name].value[index]
@@ -1414,51 +1419,51 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                     if data == "":
                         count = 0
 
-                    self.fill_dict['PixelFadeConfig'] += "\t{{ {}, Pixel_LED_DefaultFadeGroup{} }},\n".format(
+                    self.fill_dict['PixelFadeConfig'].append("\t{{ {}, Pixel_LED_DefaultFadeGroup{} }},\n".format(
                         count,
                         index,
-                    )
-                self.fill_dict['PixelFadeConfig'] += "};\n"
+                    ))
+                self.fill_dict['PixelFadeConfig'].append("};\n")
 
                 # Add fade periods
-                self.fill_dict['PixelFadeConfig'] += "const PixelPeriodConfig Pixel_LED_FadePeriods[16] = {\n"
+                self.fill_dict['PixelFadeConfig'].append("const PixelPeriodConfig Pixel_LED_FadePeriods[16] = {\n")
                 periodgroupsize = len(variables.data[defines.data['KLL_LED_FadePeriod'].name].value)
                 for index in range(periodgroupsize):
                     # Construct array
-                    self.fill_dict['PixelFadeConfig'] += "\t{}, // {}\n".format(
+                    self.fill_dict['PixelFadeConfig'].append("\t{}, // {}\n".format(
                         variables.data[defines.data['KLL_LED_FadePeriod'].name].value[index],
                         index,
-                    )
-                self.fill_dict['PixelFadeConfig'] += "};\n"
+                    ))
+                self.fill_dict['PixelFadeConfig'].append("};\n")
 
                 # Add profile brightnesses
-                self.fill_dict['PixelFadeConfig'] += "const uint8_t Pixel_LED_FadeBrightness[4] = {\n"
+                self.fill_dict['PixelFadeConfig'].append("const uint8_t Pixel_LED_FadeBrightness[4] = {\n")
                 if 'KLL_LED_FadeBrightness' in variables.data.keys():
                     fadebrightnesssize = len(variables.data[defines.data['KLL_LED_FadeBrightness'].name].value)
                     for index in range(fadebrightnesssize):
                         # Construct array
-                        self.fill_dict['PixelFadeConfig'] += "\t{}, // {}\n".format(
+                        self.fill_dict['PixelFadeConfig'].append("\t{}, // {}\n".format(
                             variables.data[defines.data['KLL_LED_FadeBrightness'].name].value[index],
                             index,
-                        )
-                self.fill_dict['PixelFadeConfig'] += "};\n"
+                        ))
+                self.fill_dict['PixelFadeConfig'].append("};\n")
 
                 def fade_default_config(name):
                     fadeconfigsize = len(variables.data[defines.data[name].name].value)
-                    self.fill_dict['PixelFadeConfig'] += "\t{ "
+                    self.fill_dict['PixelFadeConfig'].append("\t{ ")
                     for index in range(fadeconfigsize):
-                        self.fill_dict['PixelFadeConfig'] += "{}, ".format(
+                        self.fill_dict['PixelFadeConfig'].append("{}, ".format(
                             variables.data[defines.data[name].name].value[index]
-                        )
-                    self.fill_dict['PixelFadeConfig'] += "}}, // {}\n".format(name)
+                        ))
+                    self.fill_dict['PixelFadeConfig'].append("}}, // {}\n".format(name))
 
                 # Add fade configs
-                self.fill_dict['PixelFadeConfig'] += "const uint8_t Pixel_LED_FadePeriod_Defaults[4][4] = {\n"
+                self.fill_dict['PixelFadeConfig'].append("const uint8_t Pixel_LED_FadePeriod_Defaults[4][4] = {\n")
                 fade_default_config('KLL_LED_FadeDefaultConfig0')
                 fade_default_config('KLL_LED_FadeDefaultConfig1')
                 fade_default_config('KLL_LED_FadeDefaultConfig2')
                 fade_default_config('KLL_LED_FadeDefaultConfig3')
-                self.fill_dict['PixelFadeConfig'] += "};"
+                self.fill_dict['PixelFadeConfig'].append("};")
 
                 # Compute total number of channels (LED)
                 totalchannels = "{0} + {1}".format(
@@ -1469,7 +1474,7 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
             ## Pixel Mapping ##
             pixel_indices = full_context.query('MapExpression', 'PixelChannel')
 
-            self.fill_dict['PixelMapping'] = "const PixelElement Pixel_Mapping[] = {\n"
+            self.fill_dict['PixelMapping'] = ["const PixelElement Pixel_Mapping[] = {\n"]
 
             last_uid = 0
             for key, item in sorted(pixel_indices.data.items(), key=lambda x: x[1].pixel.uid.index):
@@ -1478,7 +1483,7 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 while last_uid != item.pixel.uid.index:
                     if last_uid > item.pixel.uid.index:
                         break
-                    self.fill_dict['PixelMapping'] += "\tPixel_Blank(), // {0}\n".format(last_uid)
+                    self.fill_dict['PixelMapping'].append("\tPixel_Blank(), // {0}\n".format(last_uid))
                     last_uid += 1
                 if last_uid > item.pixel.uid.index:
                     print("{} Large uid, there is likely a bug in the KLL file: Position {}, Looking for {}".format(
@@ -1492,22 +1497,22 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 # Lookup width and number of channels
                 width = item.pixel.channels[0].width
                 channels = len(item.pixel.channels)
-                self.fill_dict['PixelMapping'] += "\t{{ {0}, {1}, {{".format(width, channels)
+                self.fill_dict['PixelMapping'].append("\t{{ {0}, {1}, {{".format(width, channels))
 
                 # Iterate over the channels (assuming same width)
                 for ch in range(channels):
                     # Add comma if not first channel
                     if ch != 0:
-                        self.fill_dict['PixelMapping'] += ","
-                    self.fill_dict['PixelMapping'] += "{0}".format(item.pixel.channels[ch].uid)
-                self.fill_dict['PixelMapping'] += "}} }}, // {0}\n".format(key)
+                        self.fill_dict['PixelMapping'].append(",")
+                    self.fill_dict['PixelMapping'].append("{0}".format(item.pixel.channels[ch].uid))
+                self.fill_dict['PixelMapping'].append("}} }}, // {0}\n".format(key))
 
             totalpixels = last_uid
-            self.fill_dict['PixelMapping'] += "};"
+            self.fill_dict['PixelMapping'].append("};")
 
             ## ScanCode to Pixel Mapping ##
-            self.fill_dict['ScanCodeToPixelMapping'] = "const uint16_t Pixel_ScanCodeToPixel[] = {\n"
-            self.fill_dict['ScanCodeToDisplayMapping'] = "const uint16_t Pixel_ScanCodeToDisplay[] = {\n"
+            self.fill_dict['ScanCodeToPixelMapping'] = ["const uint16_t Pixel_ScanCodeToPixel[] = {\n"]
+            self.fill_dict['ScanCodeToDisplayMapping'] = ["const uint16_t Pixel_ScanCodeToDisplay[] = {\n"]
 
             # Add row, column of Pixel to json (mirror lookup to Scan Code Positions as well)
             for y, elem in enumerate(pixel_display_mapping):
@@ -1530,15 +1535,15 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 # Add ScanCodeToDisplayMapping entry
                 while item.position.uid != last_scancode and item.position.uid >= last_scancode:
                     # Fill in unused scancodes
-                    self.fill_dict['ScanCodeToPixelMapping'] += "\t/*{0}*/ 0,\n".format(last_scancode)
-                    self.fill_dict['ScanCodeToDisplayMapping'] += "\t/*__,__ {0}*/ 0,\n".format(last_scancode)
+                    self.fill_dict['ScanCodeToPixelMapping'].append("\t/*{0}*/ 0,\n".format(last_scancode))
+                    self.fill_dict['ScanCodeToDisplayMapping'].append("\t/*__,__ {0}*/ 0,\n".format(last_scancode))
                     last_scancode += 1
 
-                self.fill_dict['ScanCodeToPixelMapping'] += "\t/*{0}*/ {1}, // {2}\n".format(
+                self.fill_dict['ScanCodeToPixelMapping'].append("\t/*{0}*/ {1}, // {2}\n".format(
                     last_scancode,
                     item.pixel.uid.index,
                     key
-                )
+                ))
 
                 # Find Pixel_DisplayMapping offset
                 offset_row = 0
@@ -1557,23 +1562,24 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                     offset_row += 1
                     offset_col = 0
 
-                self.fill_dict['ScanCodeToDisplayMapping'] += "\t/*{3: >2},{4: >2} {0}*/ {1}, // {2}\n".format(
+                self.fill_dict['ScanCodeToDisplayMapping'].append("\t/*{3: >2},{4: >2} {0}*/ {1}, // {2}\n".format(
                     last_scancode,
                     offset,
                     key,
                     offset_col,
                     offset_row,
-                )
+                ))
             max_pixel_to_scancode = last_scancode
-            self.fill_dict['ScanCodeToPixelMapping'] += "};"
-            self.fill_dict['ScanCodeToDisplayMapping'] += "};"
+            self.fill_dict['ScanCodeToPixelMapping'].append("};")
+            self.fill_dict['ScanCodeToDisplayMapping'].append("};")
 
             ## Pixel Display Mapping ##
-            self.fill_dict['PixelDisplayMapping'] = "const uint16_t Pixel_DisplayMapping[] = {\n"
+            self.fill_dict['PixelDisplayMapping'] = ["const uint16_t Pixel_DisplayMapping[] = {\n"]
             for y_list in pixel_display_mapping:
-                self.fill_dict['PixelDisplayMapping'] += \
-                        ",".join("{0: >3}".format(x) for x in y_list) + ",\n"
-            self.fill_dict['PixelDisplayMapping'] += "};"
+                self.fill_dict['PixelDisplayMapping'].append(
+                    ",".join("{0: >3}".format(x) for x in y_list) + ",\n"
+                )
+            self.fill_dict['PixelDisplayMapping'].append("};")
 
             ## Gamma Table Generation ##
             gamma = float(variables.data['LEDGamma'].value) if 'LEDGamma' in variables.data else 1.0
@@ -1584,9 +1590,9 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
             ## Animations ##
             # TODO - Use reduced_contexts and generate per-layer (naming gets tricky)
             #        Currently using full_context which is not as configurable
-            self.fill_dict['Animations'] = "const uint8_t **Pixel_Animations[] = {"
-            self.fill_dict['AnimationSettings'] = "const AnimationStackElement Pixel_AnimationSettings[] = {"
-            self.fill_dict['AnimationList'] = ""
+            self.fill_dict['Animations'] = ["const uint8_t **Pixel_Animations[] = {"]
+            self.fill_dict['AnimationSettings'] = ["const AnimationStackElement Pixel_AnimationSettings[] = {"]
+            self.fill_dict['AnimationList'] = []
             animations = full_context.query('DataAssociationExpression', 'Animation')
             count = 0
             for key, animation in sorted(animations.data.items()):
@@ -1594,19 +1600,19 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 uid = animation_uid_lookup[animation.association.name]
 
                 # Name each frame collection
-                self.fill_dict['Animations'] += "\n\t/*{0}*/ {1}_frames,".format(
+                self.fill_dict['Animations'].append("\n\t/*{0}*/ {1}_frames,".format(
                     uid,
                     animation.association.name,
-                )
+                ))
 
                 # Add animation name to list
                 animation_name = "Animation__{0}".format(
                     animation.association.name
                 )
-                self.fill_dict['AnimationList'] += "\n#define {0} {1}".format(
+                self.fill_dict['AnimationList'].append("\n#define {0} {1}".format(
                     animation_name,
                     uid,
-                )
+                ))
 
                 # Map index to name (json)
                 animation_id_json[animation.association.name] = uid
@@ -1617,17 +1623,17 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 animation_settings_index_json.append(animation_entry_json)
 
                 # Generate animation settings string entry
-                self.fill_dict['AnimationSettings'] += self.animation_settings_entry(
+                self.fill_dict['AnimationSettings'].append(self.animation_settings_entry(
                     animation.value,
                     animation_name,
                     uid,
                     additional=False,
-                )
+                ))
                 count += 1
-            self.fill_dict['Animations'] += "\n};"
+            self.fill_dict['Animations'].append("\n};")
 
             # Additional Animation Settings
-            self.fill_dict['AnimationSettings'] += "\n\n\t/* Additional Settings */\n"
+            self.fill_dict['AnimationSettings'].append("\n\n\t/* Additional Settings */\n")
             while count < len(animation_settings_list):
                 animation = animation_settings[animation_settings_list[count]]
                 animation_orig = animation_settings_orig[animation_settings_list[count]]
@@ -1642,19 +1648,19 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 animation_settings_index_json.append(animation.json())
 
                 # Generate animation settings string entry
-                self.fill_dict['AnimationSettings'] += self.animation_settings_entry(
+                self.fill_dict['AnimationSettings'].append(self.animation_settings_entry(
                     animation,
                     animation_name,
                     count,
                     additional=True,
-                )
+                ))
                 count += 1
-            self.fill_dict['AnimationSettings'] += "\n};"
+            self.fill_dict['AnimationSettings'].append("\n};")
 
             ## Animation Frames ##
             # TODO - Use reduced_contexts and generate per-layer (naming gets tricky)
             #        Currently using full_context which is not as configurable
-            self.fill_dict['AnimationFrames'] = ""
+            self.fill_dict['AnimationFrames'] = []
             animation_frames = full_context.query('DataAssociationExpression', 'AnimationFrame')
             prev_aniframe_name = ""
             prev_aniframe = 0
@@ -1673,10 +1679,10 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 # Fill in frames if necessary
                 while aniframeid.index > prev_aniframe + 1:
                     prev_aniframe += 1
-                    self.fill_dict['AnimationFrames'] += "const uint8_t {0}_frame{1}[] = {{ PixelAddressType_End }};\n\n".format(
+                    self.fill_dict['AnimationFrames'].append("const uint8_t {0}_frame{1}[] = {{ PixelAddressType_End }};\n\n".format(
                         name,
                         prev_aniframe
-                    )
+                    ))
                 prev_aniframe_name = name
 
                 # Address type lookup for frames
@@ -1693,15 +1699,15 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 }
 
                 # Frame information
-                self.fill_dict['AnimationFrames'] += "// {0}".format(
+                self.fill_dict['AnimationFrames'].append("// {0}".format(
                     aniframe.kllify()
-                )
+                ))
 
                 # Generate frame
-                self.fill_dict['AnimationFrames'] += "\nconst uint8_t {0}_frame{1}[] = {{".format(
+                self.fill_dict['AnimationFrames'].append("\nconst uint8_t {0}_frame{1}[] = {{".format(
                     name,
                     aniframeid.index
-                )
+                ))
 
                 # There may be multiple Ids per frame actions (must be expanded)
                 for sub_aniframedata in aniframedata:
@@ -1712,9 +1718,9 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                             elem = elem[0]
 
                         # Select pixel address type
-                        self.fill_dict['AnimationFrames'] += "\n\t{0},".format(
+                        self.fill_dict['AnimationFrames'].append("\n\t{0},".format(
                             address_type[elem.uid.inferred_type()]
-                        )
+                        ))
 
                         # For each channel select a pixel address
                         channels = elem.uid.uid_set()
@@ -1750,7 +1756,7 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                                 channel_str += " /*{0}*/{1},".format(
                                     ch, ",".join(self.byte_split(value, 2)),
                                 )
-                        self.fill_dict['AnimationFrames'] += channel_str
+                        self.fill_dict['AnimationFrames'].append(channel_str)
 
                         # For each channel, select an operator and value
                         for pixelmod in elem.modifiers:
@@ -1763,8 +1769,8 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                             # TODO Support non-8bit values
                             channel_str += " {0},".format(pixelmod.value)
 
-                            self.fill_dict['AnimationFrames'] += channel_str
-                self.fill_dict['AnimationFrames'] += "\n\tPixelAddressType_End\n};\n\n"
+                            self.fill_dict['AnimationFrames'].append(channel_str)
+                self.fill_dict['AnimationFrames'].append("\n\tPixelAddressType_End\n};\n\n")
 
                 # Set frame number, for next frame evaluation
                 prev_aniframe = aniframeid.index
@@ -1781,7 +1787,7 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
 
         ## ScanCode Physical Positions ##
         scancode_physical = full_context.query('DataAssociationExpression', 'ScanCodePosition')
-        self.fill_dict['KeyPositions'] = "const Position Key_Positions[] = {\n"
+        self.fill_dict['KeyPositions'] = ["const Position Key_Positions[] = {\n"]
         for key, item in sorted(scancode_physical.data.items(), key=lambda x: x[1].association[0].get_uid()):
             entry = dict()
             # Acquire each dimension
@@ -1800,7 +1806,7 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                     entry[k] = float(entry[k])
 
             # Generate PositionEntry
-            self.fill_dict['KeyPositions'] += "\tPositionEntry( {0}, {1}, {2}, {3}, {4}, {5} ), // {6}\n".format(
+            self.fill_dict['KeyPositions'].append("\tPositionEntry( {0}, {1}, {2}, {3}, {4}, {5} ), // {6}\n".format(
                 entry['x'],
                 entry['y'],
                 entry['z'],
@@ -1808,45 +1814,45 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 entry['ry'],
                 entry['rz'],
                 item,
-            )
-        self.fill_dict['KeyPositions'] += "};"
+            ))
+        self.fill_dict['KeyPositions'].append("};")
 
         ## UTF-8 ##
-        self.fill_dict['UTF8Data'] = "const char* UTF8_Strings[] = {\n"
+        self.fill_dict['UTF8Data'] = ["const char* UTF8_Strings[] = {\n"]
         for key, item in utf8_strings.items():
             # Remove surrounding b'mytext' -> mytext and encode into utf-8
             output_str = '{}'.format(key.encode('utf-8'))[2:-1]
-            self.fill_dict['UTF8Data'] += '\t"{}",\n'.format(output_str)
-        self.fill_dict['UTF8Data'] += "};"
+            self.fill_dict['UTF8Data'].append('\t"{}",\n'.format(output_str))
+        self.fill_dict['UTF8Data'].append("};")
 
         ## KLL Defines ##
-        self.fill_dict['KLLDefines'] = ""
-        self.fill_dict['KLLDefines'] += "#define CapabilitiesNum_KLL {0}\n".format(len(self.capabilities_index))
-        self.fill_dict['KLLDefines'] += "#define LayerNum_KLL {0}\n".format(len(reduced_contexts))
-        self.fill_dict['KLLDefines'] += "#define ResultMacroNum_KLL {0}\n".format(len(result_index))
-        self.fill_dict['KLLDefines'] += "#define TriggerMacroNum_KLL {0}\n".format(len(trigger_index))
-        self.fill_dict['KLLDefines'] += "#define MaxScanCode_KLL {0}\n".format(max(max_scan_code))
-        self.fill_dict['KLLDefines'] += "#define RotationNum_KLL {0}\n".format(max_rotations)
-        self.fill_dict['KLLDefines'] += "#define UTF8StringsNum_KLL {0}\n".format(len(utf8_strings))
+        self.fill_dict['KLLDefines'] = []
+        self.fill_dict['KLLDefines'].append("#define CapabilitiesNum_KLL {0}\n".format(len(self.capabilities_index)))
+        self.fill_dict['KLLDefines'].append("#define LayerNum_KLL {0}\n".format(len(reduced_contexts)))
+        self.fill_dict['KLLDefines'].append("#define ResultMacroNum_KLL {0}\n".format(len(result_index)))
+        self.fill_dict['KLLDefines'].append("#define TriggerMacroNum_KLL {0}\n".format(len(trigger_index)))
+        self.fill_dict['KLLDefines'].append("#define MaxScanCode_KLL {0}\n".format(max(max_scan_code)))
+        self.fill_dict['KLLDefines'].append("#define RotationNum_KLL {0}\n".format(max_rotations))
+        self.fill_dict['KLLDefines'].append("#define UTF8StringsNum_KLL {0}\n".format(len(utf8_strings)))
 
         # Only add defines if Pixel Buffer is defined
         if self.use_pixel_map:
-            self.fill_dict['KLLDefines'] += "#define Pixel_BuffersLen_KLL {0}\n".format(bufsize)
-            self.fill_dict['KLLDefines'] += "#define Pixel_TotalChannels_KLL {0}\n".format(totalchannels)
-            self.fill_dict['KLLDefines'] += "#define Pixel_TotalPixels_KLL {0}\n".format(totalpixels)
-            self.fill_dict['KLLDefines'] += "#define Pixel_DisplayMapping_Cols_KLL {0}\n".format(
+            self.fill_dict['KLLDefines'].append("#define Pixel_BuffersLen_KLL {0}\n".format(bufsize))
+            self.fill_dict['KLLDefines'].append("#define Pixel_TotalChannels_KLL {0}\n".format(totalchannels))
+            self.fill_dict['KLLDefines'].append("#define Pixel_TotalPixels_KLL {0}\n".format(totalpixels))
+            self.fill_dict['KLLDefines'].append("#define Pixel_DisplayMapping_Cols_KLL {0}\n".format(
                 pixel_display_params['Columns']
-            )
-            self.fill_dict['KLLDefines'] += "#define Pixel_DisplayMapping_Rows_KLL {0}\n".format(
+            ))
+            self.fill_dict['KLLDefines'].append("#define Pixel_DisplayMapping_Rows_KLL {0}\n".format(
                 pixel_display_params['Rows']
-            )
-            self.fill_dict['KLLDefines'] += "#define Pixel_AnimationSettingsNum_KLL {0}\n".format(
+            ))
+            self.fill_dict['KLLDefines'].append("#define Pixel_AnimationSettingsNum_KLL {0}\n".format(
                 len(animation_settings_list)
-            )
-            self.fill_dict['KLLDefines'] += "#define AnimationNum_KLL {0}\n".format(len(animations.data))
-            self.fill_dict['KLLDefines'] += "#define MaxPixelToScanCode_KLL {0}\n".format(max_pixel_to_scancode)
+            ))
+            self.fill_dict['KLLDefines'].append("#define AnimationNum_KLL {0}\n".format(len(animations.data)))
+            self.fill_dict['KLLDefines'].append("#define MaxPixelToScanCode_KLL {0}\n".format(max_pixel_to_scancode))
         else:
-            self.fill_dict['KLLDefines'] += "#define AnimationNum_KLL 0\n"
+            self.fill_dict['KLLDefines'].append("#define AnimationNum_KLL 0\n")
 
         ## Define Validation ##
         if 'stateWordSize' in variables.data.keys():
@@ -1862,21 +1868,21 @@ class Kiibohd(Emitter, TextEmitter, JsonEmitter):
                 self.error_exit = True
 
         ## Generate USB HID Lookup ##
-        self.fill_dict['USBCDefineKeyboardMapping'] = ''
+        self.fill_dict['USBCDefineKeyboardMapping'] = []
         for pair in self.usb_c_defines[0]:
-            self.fill_dict['USBCDefineKeyboardMapping'] += "#define {} {}\n".format(*pair)
+            self.fill_dict['USBCDefineKeyboardMapping'].append("#define {} {}\n".format(*pair))
 
-        self.fill_dict['USBCDefineLEDMapping'] = ''
+        self.fill_dict['USBCDefineLEDMapping'] = []
         for pair in self.usb_c_defines[1]:
-            self.fill_dict['USBCDefineLEDMapping'] += "#define {} {}\n".format(*pair)
+            self.fill_dict['USBCDefineLEDMapping'].append("#define {} {}\n".format(*pair))
 
-        self.fill_dict['USBCDefineSystemControlMapping'] = ''
+        self.fill_dict['USBCDefineSystemControlMapping'] = []
         for pair in self.usb_c_defines[2]:
-            self.fill_dict['USBCDefineSystemControlMapping'] += "#define {} {}\n".format(*pair)
+            self.fill_dict['USBCDefineSystemControlMapping'].append("#define {} {}\n".format(*pair))
 
-        self.fill_dict['USBCDefineConsumerControlMapping'] = ''
+        self.fill_dict['USBCDefineConsumerControlMapping'] = []
         for pair in self.usb_c_defines[3]:
-            self.fill_dict['USBCDefineConsumerControlMapping'] += "#define {} {}\n".format(*pair)
+            self.fill_dict['USBCDefineConsumerControlMapping'].append("#define {} {}\n".format(*pair))
 
         ## Finish up JSON datastructures
         # TODO Testing
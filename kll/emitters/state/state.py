@@ -27,6 +27,31 @@ from kll.common.emitter import Emitter
 
 
 
+### Decorators ###
+
+# Memoized strings and values derived from other attributes
+# Only set once a cache has been warmed, so they are left out of the state dumps
+cached_attributes = frozenset([
+    '_channels_str',
+    '_elems',
+    '_kllify',
+    '_mask',
+    '_modifiers_str',
+    '_name',
+    '_position_str',
+    '_regen_str',
+    '_repr',
+    '_result_str',
+    '_sched_suffix',
+    '_schedule_str',
+    '_stores',
+    '_total_arg_bytes',
+    '_trigger_str',
+    '_width',
+])
+
+
+
 ### Classes ###
 
 class ClassEncoder(json.JSONEncoder):
@@ -52,8 +77,20 @@ class ClassEncoder(json.JSONEncoder):
             return str(o)
 
         # Print all class variables
+        # Small container classes use __slots__ (possibly across base classes) instead of, or as well as, a __dict__
+        variables = dict()
+        for cls in reversed(type(o).__mro__):
+            for key in cls.__dict__.get('__slots__', ()):
+                if hasattr(o, key):
+                    variables[key] = getattr(o, key)
+        variables.update(getattr(o, '__dict__', {}))
+
         result = dict()
-        for key, value in o.__dict__.items():
+        for key, value in variables.items():
+            # Skip caches, the dump should not depend on which have been filled
+            if key in cached_attributes:
+                continue
+
             # Avoid circular reference
             if type(o).__name__ == "AnimationModifierArg" and key=="parent":
                 value = str(value)
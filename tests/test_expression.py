@@ -0,0 +1,33 @@
+'''
+expression test
+Calls the expression helper functions directly to validate their results
+'''
+
+### Imports ###
+
+from kll.common.expression import Expression
+from kll.extern.funcparserlib.lexer import Token
+
+
+
+### Tests ###
+
+def test_point_chars():
+    '''
+    Points to multiple characters of the regenerated expression string
+    '''
+    expression = Expression(
+        Token('LOperatorData', 'U"A" '),
+        Token('Operator', ':'),
+        Token('ROperatorData', ' : U"1"'),
+        None,
+    )
+
+    output = expression.point_chars([8, 1, 3])
+    regen, pointers = output.split('\n')
+    assert regen == '\tU"A" : : U"1";'
+
+    # Positions are 1-indexed, every ^ lines up with the character it points to
+    pointers = pointers[1:]
+    assert pointers == '^ ^    ^'
+    assert [index for index, char in enumerate(pointers) if char == '^'] == [0, 2, 7]
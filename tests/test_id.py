@@ -0,0 +1,38 @@
+'''
+id test
+Calls the identifier helper functions directly to validate their results
+'''
+
+### Imports ###
+
+from kll.common.expression import MapExpression
+from kll.common.id import ScanCodeId
+
+
+
+### Tests ###
+
+def test_scancode_unique_key():
+    '''
+    Unique key of a ScanCodeId without a connect_id offset
+    '''
+    scan_code = ScanCodeId(0x05)
+    assert scan_code.unique_key() == 'S005'
+
+    # Positions do not change the key
+    scan_code.setPosition([('x', 2)])
+    assert scan_code.unique_key() == 'S005'
+
+def test_scancode_unique_key_connect_id():
+    '''
+    Unique key of a ScanCodeId after the connect_id interconnect offset is applied to its expression
+    '''
+    scan_code = ScanCodeId(0x05)
+    expression = MapExpression([[[scan_code]]], ':', [])
+    assert scan_code.unique_key() == 'S005'
+
+    expression.add_trigger_uid_offset(0x40)
+    assert scan_code.unique_key() == 'S069'
+
+    # The original uid is kept
+    assert scan_code.uid == 0x05
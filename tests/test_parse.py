@@ -0,0 +1,60 @@
+'''
+parse test
+Calls the parse helper functions directly to validate their results
+'''
+
+### Imports ###
+
+import pytest
+from kll.common.parse import Make, optionExpansion
+
+
+
+### Tests ###
+
+def test_option_expansion():
+    '''
+    Expands a single combo of two ranges, the first range changes fastest
+    '''
+    sequences = [[['a', 'b'], ['c', 'd']]]
+    assert optionExpansion(sequences) == [
+        [['a', 'c']],
+        [['b', 'c']],
+        [['a', 'd']],
+        [['b', 'd']],
+    ]
+
+def test_option_expansion_sequence():
+    '''
+    Expands ranges spread across a sequence of combos
+    '''
+    sequences = [[['a', 'b']], [['c'], ['d', 'e']]]
+    assert optionExpansion(sequences) == [
+        [['a'], ['c', 'd']],
+        [['b'], ['c', 'd']],
+        [['a'], ['c', 'e']],
+        [['b'], ['c', 'e']],
+    ]
+
+@pytest.mark.parametrize('token,time,unit', [
+    ('1s', 1.0, 's'),
+    ('10ms', 10.0, 'ms'),
+    ('5us', 5.0, 'us'),
+    ('3ns', 3.0, 'ns'),
+    ('2.5ms', 2.5, 'ms'),
+])
+def test_timing(token, time, unit):
+    '''
+    Splits timing tokens into a time and unit
+    '''
+    timing = Make.timing(token)
+    assert timing.time == time
+    assert timing.unit == unit
+
+@pytest.mark.parametrize('token', ['10', 'ms', '10m'])
+def test_timing_malformed(token):
+    '''
+    Timing tokens without a number and valid unit are rejected
+    '''
+    with pytest.raises(ValueError):
+        Make.timing(token)
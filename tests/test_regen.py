@@ -74,3 +74,36 @@ def test_regen(input_file):
                 print(''.join(diff), end="")
                 assert False
 
+def test_regen_remove():
+    '''
+    Merges removal (:-) expressions into a previous context and checks the regenerated kll file
+    '''
+    input_files = ['kll/examples/remove_base.kll', 'kll/examples/remove.kll']
+
+    # Prepare tmp directory
+    tmp_dir = os.path.join(tempfile.gettempdir(), 'kll_pytest')
+    os.makedirs(tmp_dir, exist_ok=True)
+    target_dir = tempfile.mkdtemp(suffix='-remove', prefix='regen-', dir=tmp_dir)
+    new_file = os.path.join(target_dir, 'final.kll')
+
+    # Run test
+    args = ['--emitter', 'kll', '--output-debug', '--target-dir', target_dir] + input_files
+    header_test('{} {}'.format(" ".join(input_files), target_dir), args)
+    ret = kll_run(args)
+    assert ret == 0
+
+    with open(new_file, 'r') as newfile:
+        final = newfile.read()
+
+    # Only one of the two stacked removal results is removed
+    assert '# S0x06 :- U"J";' in final
+    assert '# S0x06 :- U"I";' not in final
+
+    # Removing the only result drops the key
+    assert '# S0x07 :- U"L";' not in final
+
+    # Assigned and appended results are untouched
+    assert '# S0x06 :  U"G";' in final
+    assert '# S0x06 :+ U"H";' in final
+    assert '# S0x07 :+ U"K";' in final
+    assert '# S0x08 :  U"A";' in final